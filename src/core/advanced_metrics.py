@@ -1,4 +1,5 @@
 import ast
+import bisect
 import math
 import re
 import json
@@ -52,6 +53,13 @@ class HalsteadMetrics:
     def bugs_delivered(self) -> float:
         return self.volume / 3000
 
+_CYC_THRESH = (15, 30, 50)
+_CYC_PENALTY = (0, 10, 20, 30)
+_COG_THRESH = (25, 40)
+_COG_PENALTY = (0, 15, 25)
+_DEPTH_THRESH = (3, 5)
+_DEPTH_PENALTY = (0, 10, 15)
+
 @dataclass
 class ComplexityMetrics:
     pass
@@ -62,26 +70,14 @@ class ComplexityMetrics:
     average_complexity: float
     
     def get_score(self) -> float:
-        score = 100
-        
-        if self.cyclomatic_complexity > 50:
-            score -= 30
-        elif self.cyclomatic_complexity > 30:
-            score -= 20
-        elif self.cyclomatic_complexity > 15:
-            score -= 10
-        
-        if self.cognitive_complexity > 40:
-            score -= 25
-        elif self.cognitive_complexity > 25:
-            score -= 15
-        
-        if self.max_nesting_depth > 5:
-            score -= 15
-        elif self.max_nesting_depth > 3:
-            score -= 10
-        
-        return max(0, score)
+        # Thresholds are strict ("> 15"), so bisect_left keeps the boundary
+        # values in the lower penalty bucket.
+        penalty = (
+            _CYC_PENALTY[bisect.bisect_left(_CYC_THRESH, self.cyclomatic_complexity)]
+            + _COG_PENALTY[bisect.bisect_left(_COG_THRESH, self.cognitive_complexity)]
+            + _DEPTH_PENALTY[bisect.bisect_left(_DEPTH_THRESH, self.max_nesting_depth)]
+        )
+        return max(0, 100 - penalty)
 
 @dataclass
 class MaintainabilityMetrics:
@@ -117,28 +113,64 @@ class AdvancedMetricsCalculator:
             
             tree = ast.parse(code)
             
+            if not tree.body:
+                return self._empty_module_result(code)
+            
             halstead = self.calculate_halstead_metrics(tree, code)
             complexity = self.calculate_complexity_metrics(tree)
             maintainability = self.calculate_maintainability_metrics(tree, code)
             
-            tech_debt = self.estimate_technical_debt(
-                complexity, maintainability, len(code.split('\n'))
+            return self._build_result(
+                halstead, complexity, maintainability, code.count('\n') + 1
             )
-            
-            return {
-                'halstead': asdict(halstead) if hasattr(halstead, '__dataclass_fields__') else halstead,
-                'complexity': asdict(complexity) if hasattr(complexity, '__dataclass_fields__') else complexity,
-                'maintainability': asdict(maintainability) if hasattr(maintainability, '__dataclass_fields__') else maintainability,
-                'technical_debt_minutes': tech_debt,
-                'technical_debt_hours': tech_debt / 60,
-                'overall_quality_score': self.calculate_overall_score(
-                    complexity, maintainability
-                )
-            }
         
         except Exception as e:
             return {'error': str(e)}
     
+    def _empty_module_result(self, code: str) -> Dict[str, Any]:
+        # Blank or comment-only files (empty __init__.py) have no nodes to walk;
+        # their metrics are fixed, so the tree passes are skipped.
+        total_lines = code.count('\n') + 1
+        comment_lines = sum(1 for line in code.split('\n') if line.lstrip().startswith('#'))
+        
+        halstead = HalsteadMetrics(n1=0, n2=0, N1=0, N2=0)
+        complexity = ComplexityMetrics(
+            cyclomatic_complexity=1,
+            cognitive_complexity=0,
+            essential_complexity=1,
+            max_nesting_depth=0,
+            average_complexity=1.0
+        )
+        maintainability = MaintainabilityMetrics(
+            maintainability_index=50,
+            comment_ratio=comment_lines / total_lines,
+            documentation_ratio=0.0,
+            test_coverage_estimate=0.0
+        )
+        return self._build_result(halstead, complexity, maintainability, total_lines)
+    
+    def _build_result(
+        self,
+        halstead: HalsteadMetrics,
+        complexity: ComplexityMetrics,
+        maintainability: MaintainabilityMetrics,
+        lines_of_code: int
+    ) -> Dict[str, Any]:
+        tech_debt = self.estimate_technical_debt(
+            complexity, maintainability, lines_of_code
+        )
+        
+        return {
+            'halstead': asdict(halstead),
+            'complexity': asdict(complexity),
+            'maintainability': asdict(maintainability),
+            'technical_debt_minutes': tech_debt,
+            'technical_debt_hours': tech_debt / 60,
+            'overall_quality_score': self.calculate_overall_score(
+                complexity, maintainability
+            )
+        }
+    
     def calculate_halstead_metrics(self, tree: ast.AST, code: str) -> HalsteadMetrics:
         operators = set()
         operands = set()
@@ -271,9 +303,17 @@ class AdvancedMetricsCalculator:
     def calculate_maintainability_metrics(
         self, tree: ast.AST, code: str
     ) -> MaintainabilityMetrics:
-        lines = code.split('\n')
-        
-        comment_lines = sum(1 for line in lines if line.strip().startswith('#'))
+        total_lines = code.count('\n') + 1
+        comment_lines = 0
+        code_lines = 0
+        for line in code.split('\n'):
+            stripped = line.lstrip()
+            if not stripped:
+                continue
+            if stripped[0] == '#':
+                comment_lines += 1
+            else:
+                code_lines += 1
         
         docstring_count = 0
         for node in ast.walk(tree):
@@ -281,10 +321,7 @@ class AdvancedMetricsCalculator:
                 if (ast.get_docstring(node)):
                     docstring_count += 1
         
-        total_lines = len(lines)
-        code_lines = sum(1 for line in lines if line.strip() and not line.strip().startswith('#'))
-        
-        comment_ratio = comment_lines / max(total_lines, 1)
+        comment_ratio = comment_lines / total_lines
         documentation_ratio = docstring_count / max(
             sum(1 for _ in ast.walk(tree) if isinstance(_, (ast.FunctionDef, ast.ClassDef))),
             1
@@ -1,69 +1,234 @@
 import hashlib
 import json
+import mmap
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Union
 import logging
 
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Mapping costs more than a single read below this size
+_MMAP_MIN_BYTES = 1 << 20
+
+_MEMORY_ENTRIES = 4096
+
+
+def _dump_json(obj: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _load_json(data: bytes) -> Any:
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def content_key(file_path: Union[str, Path]) -> str:
+    # Keyed by content rather than path+mtime so entries survive branch switches
+    with open(file_path, 'rb') as f:
+        size = f.seek(0, 2)
+        if size < _MMAP_MIN_BYTES:
+            f.seek(0)
+            data = f.read()
+        else:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if BLAKE3_AVAILABLE:
+                return blake3.blake3(data, max_threads=blake3.blake3.AUTO).hexdigest()
+            if XXHASH_AVAILABLE:
+                # Keys only need to tell versions apart, not resist forgery
+                return xxhash.xxh3_128_hexdigest(data)
+            return hashlib.blake2b(data).hexdigest()
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+
+def stat_key(file_path: Union[str, Path], st: Optional[os.stat_result] = None) -> Optional[Tuple[int, int, int]]:
+    if st is None:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
 
 class AnalysisCache:
     
-    def __init__(self, cache_dir: str = ".codepulse_cache"):
+    def __init__(self, cache_dir: str = ".codepulse_cache", strict: bool = False,
+                 memory_entries: int = _MEMORY_ENTRIES):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
+        self._cache_root = os.fspath(self.cache_dir)
+        self.strict = strict
+        # path -> [mtime_ns, size, inode, content hash]: an unchanged stat
+        # reuses the remembered hash instead of reading the file again.
+        self._index_path = self.cache_dir / 'index.json'
+        self._index = self._load_index()
+        self._index_dirty = False
+        # Recently used results by entry key, so repeat lookups skip the disk
+        self.memory_entries = memory_entries
+        self._memory: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._memory_lock = threading.Lock()
         self.stats = {
             'hits': 0,
             'misses': 0
         }
         logger.info(f"Cache initialized at {self.cache_dir}")
     
-    def _get_file_hash(self, file_path: Path) -> str:
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes hash for themselves; the index stays in the parent.
+        state = self.__dict__.copy()
+        state['_index'] = {}
+        state['_index_dirty'] = False
+        state['_memory'] = OrderedDict()
+        del state['_memory_lock']
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._memory_lock = threading.Lock()
+    
+    def _remember(self, entry_key: str, result: Dict[str, Any]):
+        with self._memory_lock:
+            self._memory[entry_key] = result
+            self._memory.move_to_end(entry_key)
+            if len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+    
+    def _load_index(self) -> Dict[str, list]:
+        try:
+            with open(self._index_path, 'rb') as f:
+                return _load_json(f.read())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.error(f"Cache index read error: {e}")
+            return {}
+    
+    def save_index(self):
+        if not self._index_dirty:
+            return
+        tmp_path = self._index_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_dump_json(self._index))
+            os.replace(tmp_path, self._index_path)
+            self._index_dirty = False
+        except Exception as e:
+            logger.error(f"Cache index write error: {e}")
+    
+    def known_hash(self, file_path: Union[str, Path], st: Optional[os.stat_result] = None) -> Optional[str]:
+        # The remembered hash when the stat is unchanged, without reading the file
+        if self.strict:
+            return None
+        file_path = os.fspath(file_path)
+        key = stat_key(file_path, st)
+        entry = self._index.get(file_path)
+        if key is not None and entry is not None and tuple(entry[:3]) == key:
+            return entry[3]
+        return None
+    
+    def _get_file_hash(self, file_path: Union[str, Path], st: Optional[os.stat_result] = None) -> str:
+        # st lets a caller that already stat-ed the file (the directory walk) skip another call
+        file_path = os.fspath(file_path)
+        file_hash = self.known_hash(file_path, st)
+        if file_hash is not None:
+            return file_hash
+        key = None if self.strict else stat_key(file_path, st)
         try:
-            with open(file_path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
+            file_hash = content_key(file_path)
         except Exception as e:
             logger.error(f"Error hashing {file_path}: {e}")
             return ""
+        if key is not None:
+            self._index[file_path] = [*key, file_hash]
+            self._index_dirty = True
+        return file_hash
+    
+    def _entry_key(self, file_path: str, file_hash: str) -> str:
+        # Results carry their file's path, so byte-identical files must not
+        # share an entry; the path and content together still survive branch switches.
+        return hashlib.blake2b(f"{file_path}\0{file_hash}".encode('utf-8', 'surrogateescape'),
+                               digest_size=16).hexdigest()
     
-    def _get_cache_path(self, file_hash: str) -> Path:
-        return self.cache_dir / f"{file_hash[:16]}.json"
+    def _get_cache_path(self, entry_key: str) -> str:
+        return os.path.join(self._cache_root, f"{entry_key}.json")
     
-    def get(self, file_path: Path) -> Optional[Dict[str, Any]]:
+    def get(self, file_path: Union[str, Path], file_hash: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        file_path = os.fspath(file_path)
         try:
-            file_hash = self._get_file_hash(file_path)
+            if file_hash is None:
+                file_hash = self._get_file_hash(file_path)
             if not file_hash:
                 return None
+            entry_key = self._entry_key(file_path, file_hash)
             
-            cache_path = self._get_cache_path(file_hash)
-            
-            if cache_path.exists():
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    result = json.load(f)
+            with self._memory_lock:
+                result = self._memory.get(entry_key)
+                if result is not None:
+                    self._memory.move_to_end(entry_key)
+            if result is not None:
                 self.stats['hits'] += 1
-                logger.debug(f"Cache HIT: {file_path.name}")
+                logger.debug(f"Cache HIT (memory): {os.path.basename(file_path)}")
                 return result
             
-            self.stats['misses'] += 1
-            logger.debug(f"Cache MISS: {file_path.name}")
-            return None
+            try:
+                with open(self._get_cache_path(entry_key), 'rb') as f:
+                    result = _load_json(f.read())
+            except FileNotFoundError:
+                self.stats['misses'] += 1
+                logger.debug(f"Cache MISS: {os.path.basename(file_path)}")
+                return None
+            
+            self._remember(entry_key, result)
+            self.stats['hits'] += 1
+            logger.debug(f"Cache HIT: {os.path.basename(file_path)}")
+            return result
             
         except Exception as e:
             logger.error(f"Cache read error for {file_path}: {e}")
             return None
     
-    def set(self, file_path: Path, result: Dict[str, Any]) -> bool:
+    def set(self, file_path: Union[str, Path], result: Dict[str, Any], file_hash: Optional[str] = None) -> bool:
+        file_path = os.fspath(file_path)
         try:
-            file_hash = self._get_file_hash(file_path)
+            if file_hash is None:
+                file_hash = self._get_file_hash(file_path)
             if not file_hash:
                 return False
+            entry_key = self._entry_key(file_path, file_hash)
             
-            cache_path = self._get_cache_path(file_hash)
+            cache_path = self._get_cache_path(entry_key)
             
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2)
+            # Stays JSON: a pickle in a project-local directory would run
+            # whatever code a checked-out repository put there.
+            with open(cache_path, 'wb') as f:
+                f.write(_dump_json(result))
+            self._remember(entry_key, result)
             
-            logger.debug(f"Cached: {file_path.name}")
+            logger.debug(f"Cached: {os.path.basename(file_path)}")
             return True
             
         except Exception as e:
@@ -75,6 +240,10 @@ class AnalysisCache:
         if self.cache_dir.exists():
             shutil.rmtree(self.cache_dir)
             self.cache_dir.mkdir()
+        self._index = {}
+        self._index_dirty = False
+        with self._memory_lock:
+            self._memory.clear()
         self.stats = {'hits': 0, 'misses': 0}
         logger.info("Cache cleared")
     
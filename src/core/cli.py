@@ -33,7 +33,9 @@ def cli():
 @click.option('--depth', default=10, help='Maximum directory depth to scan')
 @click.option('--output', '-o', type=click.Path(), help='Output file for results (JSON)')
 @click.option('--verbose', '-v', is_flag=True, help='Verbose output')
-def scan(project_path, depth, output, verbose):
+@click.option('--cache-file', type=click.Path(dir_okay=False), help='Reuse Python AST analyses across runs (JSON)')
+@click.option('--no-ignore', is_flag=True, help='Scan files matched by .gitignore')
+def scan(project_path, depth, output, verbose, cache_file, no_ignore):
     if verbose:
         logging.getLogger().setLevel(logging.INFO)
     
@@ -52,7 +54,8 @@ def scan(project_path, depth, output, verbose):
         ) as progress:
             task = progress.add_task("Scanning project...", total=None)
             
-            scanner = PulseScanner(project_path, max_depth=depth)
+            scanner = PulseScanner(project_path, max_depth=depth, cache_file=cache_file,
+                                   use_gitignore=not no_ignore)
             structure = scanner.scan()
             
             progress.update(task, completed=True)
@@ -6,6 +6,10 @@ from dataclasses import dataclass, field
 from collections import defaultdict
 import networkx as nx
 
+# Pruned by exact name so the walk never descends into them; a substring test
+# on the joined path also skipped '.github' or any directory named '*venv*'.
+_SKIP_DIRS = frozenset(('__pycache__', '.git', 'venv', '.venv'))
+
 @dataclass
 class CrossFileIssue:
     pass
@@ -58,9 +62,8 @@ class ArchitectureAnalyzer:
     
     def _find_python_files(self, root_path: str) -> List[str]:
         files = []
-        for root, _, filenames in os.walk(root_path):
-            if '__pycache__' in root or 'venv' in root or '.git' in root:
-                continue
+        for root, dirnames, filenames in os.walk(root_path):
+            dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
             for filename in filenames:
                 if filename.endswith('.py'):
                     files.append(os.path.join(root, filename))
@@ -1,19 +1,23 @@
+import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Callable, Iterable, List, Dict, Any, Optional, Union
 import logging
 import time
 
 from .parallel_scanner import ParallelScanner, analyze_file_wrapper
 from .cache import AnalysisCache
 from .incremental_analyzer import IncrementalAnalyzer
+from .file_walker import walk_files_parallel
 
 logger = logging.getLogger(__name__)
 
 
 class FastScanner:
     
-    def __init__(self, max_workers: Optional[int] = None, use_cache: bool = True, use_incremental: bool = True):
+    def __init__(self, max_workers: Optional[int] = None, use_cache: bool = True, use_incremental: bool = True,
+                 traversal_workers: int = 8):
         self.parallel = ParallelScanner(max_workers)
+        self.traversal_workers = traversal_workers
         self.cache = AnalysisCache() if use_cache else None
         self.incremental = IncrementalAnalyzer() if use_incremental else None
         self.use_cache = use_cache
@@ -21,23 +25,58 @@ class FastScanner:
         
         logger.info(f"FastScanner initialized:")
         logger.info(f"  - Parallel processing: {self.parallel.max_workers} workers")
+        logger.info(f"  - Traversal threads: {traversal_workers}")
         logger.info(f"  - Caching: {'enabled' if use_cache else 'disabled'}")
         logger.info(f"  - Incremental: {'enabled' if use_incremental else 'disabled'}")
     
-    def _analyze_with_cache(self, file_path: Path) -> Dict[str, Any]:
-        if self.use_cache and self.cache:
-            cached = self.cache.get(file_path)
+    def _sizes(self, files: List[str], stats: Dict[str, os.stat_result]) -> List[Optional[int]]:
+        return [st.st_size if st is not None else None for st in map(stats.get, files)]
+    
+    def _scan_files(self, files: List[str], stats: Dict[str, os.stat_result],
+                    on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        if not (self.use_cache and self.cache):
+            return self.parallel.scan_files(files, analyze_file_wrapper, on_result, self._sizes(files, stats))
+        
+        # Lookups and stores stay in this process, where the stat index, the
+        # hit counters and the in-memory entries live; workers only analyze.
+        # Unchanged files take their hash from the index; the rest are hashed
+        # on the shared threads rather than one after another here.
+        hashes = [self.cache.known_hash(file, stats.get(file)) for file in files]
+        unknown = [index for index, file_hash in enumerate(hashes) if file_hash is None]
+        computed = self.parallel.map_io(
+            lambda index: self.cache._get_file_hash(files[index], stats.get(files[index])), unknown
+        )
+        for index, file_hash in zip(unknown, computed):
+            hashes[index] = file_hash
+        
+        results = [None] * len(files)
+        misses = []
+        file_hashes = {}
+        for index, file in enumerate(files):
+            file_hash = hashes[index]
+            cached = self.cache.get(file, file_hash)
             if cached:
-                return cached
-        
-        result = analyze_file_wrapper(file_path)
-        
-        if self.use_cache and self.cache and result.get('status') == 'success':
-            self.cache.set(file_path, result)
-        
-        return result
+                results[index] = cached
+                if on_result is not None:
+                    on_result(file, cached)
+            else:
+                misses.append(index)
+                file_hashes[file] = file_hash
+        
+        def store(file: str, result: Dict[str, Any]):
+            if result.get('status') == 'success':
+                self.cache.set(file, result, file_hashes.get(file))
+            if on_result is not None:
+                on_result(file, result)
+        
+        missed = [files[i] for i in misses]
+        analyzed = self.parallel.scan_files(missed, analyze_file_wrapper, store, self._sizes(missed, stats))
+        for index, result in zip(misses, analyzed):
+            results[index] = result
+        return results
     
-    def scan_project(self, project_path: str, file_pattern: str = '*.py') -> Dict[str, Any]:
+    def scan_project(self, project_path: str, file_pattern: str = '*.py',
+                     changed_files: Optional[Iterable[Union[str, Path]]] = None) -> Dict[str, Any]:
         project = Path(project_path)
         start_time = time.time()
         
@@ -47,7 +86,8 @@ class FastScanner:
                 'stats': {}
             }
         
-        all_files = list(project.rglob(file_pattern))
+        entries = list(walk_files_parallel(project, file_pattern, self.traversal_workers))
+        all_files = [path for path, _ in entries]
         logger.info(f"Found {len(all_files)} {file_pattern} files")
         
         if not all_files:
@@ -62,19 +102,48 @@ class FastScanner:
             }
         
         files_to_analyze = all_files
-        
-        if self.use_incremental and self.incremental:
-            changed_files = self.incremental.get_changed_files(all_files)
+        root = os.path.abspath(project)
+        fingerprint = None
+        unchanged = False
+        
+        if changed_files is not None:
+            # Caller already knows what changed (editor save hook, pre-commit),
+            # so the stat/hash comparison is skipped entirely.
+            files_to_analyze = [os.fspath(path) for path in changed_files]
+            logger.info(f"Explicit change list: analyzing {len(files_to_analyze)} files")
+        elif self.use_incremental and self.incremental:
+            fingerprint = self.incremental.project_fingerprint(entries)
+            unchanged = fingerprint == self.incremental.stored_fingerprint(root)
+            changed_files = None if unchanged else self.incremental.get_changed_files_with_stats(entries)
             if changed_files:
-                files_to_analyze = list(changed_files)
+                files_to_analyze = [path for path in all_files if path in changed_files]
                 logger.info(f"Incremental mode: analyzing {len(files_to_analyze)} changed files")
             else:
                 logger.info("No changes detected")
         
-        results = self.parallel.scan_files(files_to_analyze, self._analyze_with_cache)
+        # The walk already stat-ed every file; the cache reuses those
+        stats = dict(entries)
+        
+        if unchanged:
+            # Recorded state already matches every file; only the cache is needed
+            results = self._scan_files(files_to_analyze, stats)
+        elif self.use_incremental and self.incremental:
+            entry_by_file = {path: (path, st) for path, st in entries}
+            
+            def record(file: str, result: Dict[str, Any]):
+                entry = entry_by_file.pop(file, None)
+                if entry is not None:
+                    self.incremental.update_one(*entry)
+            
+            results = self._scan_files(files_to_analyze, stats, record)
+            self.incremental.flush()
+            self.incremental.update_state_with_stats(entry_by_file.values())
+            self.incremental.store_fingerprint(root, fingerprint or self.incremental.project_fingerprint(entries))
+        else:
+            results = self._scan_files(files_to_analyze, stats)
         
-        if self.use_incremental and self.incremental:
-            self.incremental.update_state(all_files)
+        if self.use_cache and self.cache:
+            self.cache.save_index()
         
         duration = time.time() - start_time
         
@@ -106,6 +175,15 @@ class FastScanner:
             'stats': stats
         }
     
+    def close(self):
+        self.parallel.close()
+    
+    def __enter__(self) -> 'FastScanner':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
     def clear_cache(self):
         if self.cache:
             self.cache.clear()
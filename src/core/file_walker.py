@@ -0,0 +1,68 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from typing import Callable, Iterator, List, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _name_matcher(file_pattern: str) -> Callable[[str], bool]:
+    # '*.py'-style patterns reduce to a suffix test; anything else goes through fnmatch
+    if file_pattern.startswith('*') and not any(c in file_pattern[1:] for c in '*?['):
+        suffix = file_pattern[1:]
+        return lambda name: name.endswith(suffix)
+    return lambda name: fnmatch(name, file_pattern)
+
+
+def _scan_dir(
+    directory: str, matches: Callable[[str], bool]
+) -> Tuple[List[str], List[Tuple[str, os.stat_result]]]:
+    subdirs = []
+    files = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif matches(entry.name) and entry.is_file():
+                        files.append((entry.path, entry.stat()))
+                except OSError as e:
+                    logger.debug(f"Skipping {entry.path}: {e}")
+    except OSError as e:
+        logger.debug(f"Cannot list directory: {e}")
+    # Sorted so every run yields the same order whatever the filesystem returns
+    subdirs.sort()
+    files.sort()
+    return subdirs, files
+
+
+def walk_files(root: str, file_pattern: str = '*.py') -> Iterator[Tuple[str, os.stat_result]]:
+    # Pre-order: a directory's files, then each subdirectory in name order.
+    # Symlinked directories are not entered, as with pathlib's rglob.
+    matches = _name_matcher(file_pattern)
+    stack = [str(root)]
+    while stack:
+        subdirs, files = _scan_dir(stack.pop(), matches)
+        stack.extend(reversed(subdirs))
+        yield from files
+
+
+def walk_files_parallel(
+    root: str, file_pattern: str = '*.py', workers: int = 8
+) -> Iterator[Tuple[str, os.stat_result]]:
+    # Listing is latency-bound on network filesystems, so every subdirectory
+    # is submitted as soon as its parent is listed, while results are still
+    # consumed in walk_files' order so the output does not depend on timing.
+    if workers <= 1:
+        yield from walk_files(root, file_pattern)
+        return
+    
+    matches = _name_matcher(file_pattern)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        stack = [executor.submit(_scan_dir, str(root), matches)]
+        while stack:
+            subdirs, files = stack.pop().result()
+            stack.extend(reversed([executor.submit(_scan_dir, subdir, matches) for subdir in subdirs]))
+            yield from files
@@ -1,76 +1,271 @@
-import json
+import hashlib
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Set, Any
+from typing import Dict, Iterable, List, Optional, Set, Any, Tuple
 import logging
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Below this many paths a pool costs more than the stats it overlaps
+_PARALLEL_STAT_MIN = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime INTEGER NOT NULL,
+    hash TEXT
+) WITHOUT ROWID
+"""
+
+_PROJECTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    root TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL
+) WITHOUT ROWID
+"""
+
 
 class IncrementalAnalyzer:
     
-    def __init__(self, state_file: str = ".codepulse_state.json"):
+    def __init__(self, state_file: str = ".codepulse_state.db", batch_size: int = 1000,
+                 io_parallelism: int = 1):
         self.state_file = Path(state_file)
-        self.state = self._load_state()
-        logger.info(f"Incremental analyzer initialized with {len(self.state.get('files', {}))} tracked files")
+        self.batch_size = batch_size
+        # Stats in flight at once; worth raising on NFS/SMB where each one
+        # waits on a round-trip rather than the local disk.
+        self.io_parallelism = io_parallelism
+        self._conn = None
+        self._pending = []
+        # The database is opened on first use, not here
+        logger.info(f"Incremental analyzer initialized with state at {self.state_file}")
     
-    def _load_state(self) -> Dict:
-        if self.state_file.exists():
-            try:
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Error loading state: {e}")
-                return {'files': {}}
-        return {'files': {}}
-    
-    def _save_state(self):
+    def __getstate__(self) -> Dict[str, Any]:
+        # Connections cannot cross process boundaries; workers reconnect lazily.
+        state = self.__dict__.copy()
+        state['_conn'] = None
+        state['_pending'] = []
+        return state
+    
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.state_file), isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.execute(_PROJECTS_SCHEMA)
+        return self._conn
+    
+    def _lookup(self, paths: List[str]) -> Dict[str, Tuple[int, int, Optional[str]]]:
+        conn = self.conn
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS lookup (path TEXT PRIMARY KEY)")
+        conn.execute("BEGIN")
+        try:
+            conn.execute("DELETE FROM lookup")
+            conn.executemany("INSERT OR IGNORE INTO lookup (path) VALUES (?)", ((p,) for p in paths))
+            rows = conn.execute(
+                "SELECT f.path, f.size, f.mtime, f.hash FROM files f JOIN lookup l ON f.path = l.path"
+            ).fetchall()
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return {path: (size, mtime, file_hash) for path, size, mtime, file_hash in rows}
+    
+    def _write(self, sql: str, rows: List[Tuple]):
+        if not rows:
+            logger.debug("State unchanged, skipping write")
+            return
+        
+        conn = None
         try:
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(self.state, f, indent=2)
+            conn = self.conn
+            conn.execute("BEGIN")
+            conn.executemany(sql, rows)
+            conn.execute("COMMIT")
             logger.debug("State saved successfully")
         except Exception as e:
+            if conn is not None and conn.in_transaction:
+                conn.execute("ROLLBACK")
             logger.error(f"Error saving state: {e}")
     
-    def _get_file_mtime(self, file_path: Path) -> float:
+    def _get_file_stat(self, file_path: str) -> Tuple[int, int]:
         try:
-            return file_path.stat().st_mtime
+            st = os.stat(file_path)
+            return st.st_size, st.st_mtime_ns
         except Exception as e:
-            logger.error(f"Error getting mtime for {file_path}: {e}")
-            return 0.0
+            logger.error(f"Error getting stat for {file_path}: {e}")
+            return -1, 0
     
-    def get_changed_files(self, files: List[Path]) -> Set[Path]:
+    def _stat_many(self, files: Iterable[str]) -> List[Tuple[str, int, int]]:
+        if os.name != 'nt':
+            files = list(files)
+            if self.io_parallelism > 1 and len(files) > _PARALLEL_STAT_MIN:
+                with ThreadPoolExecutor(max_workers=self.io_parallelism) as executor:
+                    stats = list(executor.map(self._get_file_stat, files))
+            else:
+                stats = map(self._get_file_stat, files)
+            return [(file_str, *st) for file_str, st in zip(files, stats)]
+        
+        # DirEntry.stat() is served from the directory listing on Windows, so one
+        # scandir per parent replaces a stat call per file.
+        by_parent: Dict[str, List[str]] = {}
+        for file_str in files:
+            by_parent.setdefault(os.path.dirname(file_str), []).append(file_str)
+        
+        entries = []
+        for parent, group in by_parent.items():
+            try:
+                with os.scandir(parent or '.') as it:
+                    listed = {entry.name: entry for entry in it}
+            except OSError:
+                listed = {}
+            for file_str in group:
+                entry = listed.get(os.path.basename(file_str))
+                try:
+                    st = entry.stat() if entry is not None else os.stat(file_str)
+                except OSError as e:
+                    logger.error(f"Error getting stat for {file_str}: {e}")
+                    entries.append((file_str, -1, 0))
+                    continue
+                entries.append((file_str, st.st_size, st.st_mtime_ns))
+        return entries
+    
+    def _hasher(self):
+        return xxhash.xxh3_64() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=16)
+    
+    def _hash_file(self, file_path: str) -> Optional[str]:
+        hasher = self._hasher()
+        try:
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    hasher.update(chunk)
+            return hasher.hexdigest()
+        except Exception as e:
+            logger.error(f"Error hashing {file_path}: {e}")
+            return None
+    
+    def _find_changed(self, entries: List[Tuple[str, int, int]]) -> Set[str]:
         changed = set()
+        touched = []
+        
+        try:
+            known = self._lookup([file_str for file_str, _, _ in entries])
+        except Exception as e:
+            logger.error(f"Error loading state: {e}")
+            known = {}
         
-        for file in files:
-            file_str = str(file)
-            current_mtime = self._get_file_mtime(file)
+        for file_str, size, mtime in entries:
+            entry = known.get(file_str)
+            
+            if entry is None:
+                changed.add(file_str)
+                logger.debug(f"New file: {file_str}")
+                continue
+            
+            old_size, old_mtime, old_hash = entry
+            if old_size == size and old_mtime == mtime:
+                continue
             
-            if file_str not in self.state['files']:
-                changed.add(file)
-                logger.debug(f"New file: {file.name}")
-            elif self.state['files'][file_str] != current_mtime:
-                changed.add(file)
-                logger.debug(f"Modified file: {file.name}")
+            # Timestamps move on checkout/restore without the content changing;
+            # only a matching content hash proves the file is untouched.
+            if old_size == size and old_hash and self._hash_file(file_str) == old_hash:
+                touched.append((mtime, file_str))
+                logger.debug(f"Touched but unchanged: {file_str}")
+                continue
+            
+            changed.add(file_str)
+            logger.debug(f"Modified file: {file_str}")
         
-        logger.info(f"Found {len(changed)}/{len(files)} changed files")
+        self._write("UPDATE files SET mtime = ? WHERE path = ?", touched)
+        logger.info(f"Found {len(changed)}/{len(entries)} changed files")
         return changed
     
-    def update_state(self, files: List[Path]):
-        for file in files:
-            file_str = str(file)
-            mtime = self._get_file_mtime(file)
-            self.state['files'][file_str] = mtime
+    def _record(self, entries: List[Tuple[str, int, int]]):
+        try:
+            known = self._lookup([file_str for file_str, _, _ in entries])
+        except Exception as e:
+            logger.error(f"Error loading state: {e}")
+            known = {}
+        
+        rows = []
+        for file_str, size, mtime in entries:
+            entry = known.get(file_str)
+            if entry is not None and entry[0] == size and entry[1] == mtime:
+                continue
+            rows.append((file_str, size, mtime, self._hash_file(file_str)))
         
-        self._save_state()
-        logger.info(f"State updated with {len(files)} files")
+        self._write("INSERT OR REPLACE INTO files (path, size, mtime, hash) VALUES (?, ?, ?, ?)", rows)
+        logger.info(f"State updated with {len(entries)} files")
+    
+    def get_changed_files(self, files: List[str]) -> Set[str]:
+        return self._find_changed(self._stat_many(map(os.fspath, files)))
+    
+    def get_changed_files_with_stats(
+        self, entries: Iterable[Tuple[str, os.stat_result]]
+    ) -> Set[str]:
+        return self._find_changed(
+            [(file_str, st.st_size, st.st_mtime_ns) for file_str, st in entries]
+        )
+    
+    def update_state(self, files: List[str]):
+        self._record(self._stat_many(map(os.fspath, files)))
+    
+    def update_state_with_stats(self, entries: Iterable[Tuple[str, os.stat_result]]):
+        self._record([(file_str, st.st_size, st.st_mtime_ns) for file_str, st in entries])
+    
+    def update_one(self, file_str: str, st: os.stat_result):
+        # Commits every batch_size files so an interrupted scan keeps its progress
+        self._pending.append((file_str, st.st_size, st.st_mtime_ns))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+    
+    def flush(self):
+        if self._pending:
+            pending, self._pending = self._pending, []
+            self._record(pending)
+    
+    def project_fingerprint(self, entries: Iterable[Tuple[str, os.stat_result]]) -> str:
+        # One digest over every (path, size, mtime) the walk saw; a match means
+        # no file was added, removed or touched since the last recorded scan.
+        hasher = self._hasher()
+        for file_str, st in sorted(entries, key=itemgetter(0)):
+            hasher.update(f"{file_str}\0{st.st_size}\0{st.st_mtime_ns}\n".encode('utf-8', 'surrogateescape'))
+        return hasher.hexdigest()
+    
+    def stored_fingerprint(self, root: str) -> Optional[str]:
+        try:
+            row = self.conn.execute("SELECT fingerprint FROM projects WHERE root = ?", (root,)).fetchone()
+        except Exception as e:
+            logger.error(f"Error reading state: {e}")
+            return None
+        return row[0] if row else None
+    
+    def store_fingerprint(self, root: str, fingerprint: str):
+        self._write("INSERT OR REPLACE INTO projects (root, fingerprint) VALUES (?, ?)", [(root, fingerprint)])
     
     def reset(self):
-        self.state = {'files': {}}
-        if self.state_file.exists():
-            self.state_file.unlink()
+        self._pending = []
+        self.conn.execute("DELETE FROM files")
+        self.conn.execute("DELETE FROM projects")
         logger.info("State reset")
     
     def get_stats(self) -> Dict[str, int]:
+        try:
+            tracked = self.conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+        except Exception as e:
+            logger.error(f"Error reading state: {e}")
+            tracked = 0
         return {
-            'tracked_files': len(self.state.get('files', {}))
+            'tracked_files': tracked
         }
@@ -1,63 +1,98 @@
+import mmap
+import os
 import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple, Union
 from pathlib import Path
 
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+def _compile_linear(pattern: bytes):
+    # RE2 guarantees linear-time matching on adversarial input; fall back to
+    # the stdlib engine when it is not installed or rejects the pattern.
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+# Scanning runs on the raw bytes and only captured names are decoded. Bytes
+# \w is ASCII-only, so identifiers also take any UTF-8 byte (and '$').
+_IDENT = rb'[\w\x80-\xff$]+'
+
+_PATTERNS = {
+    'import': re.compile(rb'import\s+.*?\s+from\s+[\'"](.+?)[\'"]'),
+    'require': re.compile(rb'require\([\'"](.+?)[\'"]\)'),
+    'function': re.compile(rb'(?:function\s+(' + _IDENT + rb')|const\s+(' + _IDENT + rb')\s*=\s*(?:async\s+)?\([^)]*\)\s*=>|('
+                           + _IDENT + rb')\s*:\s*(?:async\s+)?\([^)]*\)\s*=>)'),
+    'class': re.compile(rb'class\s+(' + _IDENT + rb')'),
+    'const': re.compile(rb'const\s+(' + _IDENT + rb')'),
+    'let': re.compile(rb'let\s+(' + _IDENT + rb')'),
+    'var': re.compile(rb'var\s+(' + _IDENT + rb')'),
+    'export': re.compile(rb'export\s+(?:default\s+)?(?:class|function|const)\s+(' + _IDENT + rb')'),
+    'async': re.compile(rb'async\s+function'),
+    'promise': re.compile(rb'new\s+Promise|\.then\(|\.catch\(|await\s+'),
+    'comment_single': re.compile(rb'//.*$', re.MULTILINE),
+    'comment_multi': re.compile(rb'/\*.*?\*/', re.DOTALL),
+}
+
+# Single-pass tokenizer: one finditer over the file feeds imports,
+# functions, classes and exports, dispatching on lastgroup.
+# Exports are matched whole and re-credited to the function/class they
+# declare, since the alternation cannot report overlapping matches.
+_TOKEN_RE = _compile_linear(
+    rb'(?P<import>import\s+.*?\s+from\s+[\'"](?P<import_name>.+?)[\'"])'
+    rb'|(?P<require>require\([\'"](?P<require_name>.+?)[\'"]\))'
+    rb'|(?P<export>export\s+(?:default\s+)?(?P<export_kind>class|function|const)\s+(?P<export_name>' + _IDENT + rb')'
+    rb'(?P<export_arrow>\s*=\s*(?:async\s+)?\([^)]*\)\s*=>)?)'
+    rb'|(?P<function>function\s+(?P<function_name>' + _IDENT + rb')'
+    rb'|const\s+(?P<arrow_name>' + _IDENT + rb')\s*=\s*(?:async\s+)?\([^)]*\)\s*=>'
+    rb'|(?P<method_name>' + _IDENT + rb')\s*:\s*(?:async\s+)?\([^)]*\)\s*=>)'
+    rb'|(?P<class>class\s+(?P<class_name>' + _IDENT + rb'))'
+)
+
+# Complexity keeps its own pass: inside the tokenizer, keywords swallowed by a
+# longer token (an import clause, an arrow's parameter list) went uncounted.
+# Operators only count between word characters ('a&&b', 'x?y'), which also
+# keeps optional chaining '?.' and TypeScript '?:' out.
+_BRANCH_RE = _compile_linear(rb'\b(?:if|else|for|while|case|catch)\b|\b(?:\?|&&|\|\|)\b')
+
+# One pass collects every marker _detect_file_type cares about
+_TYPE_RE = _compile_linear(rb'import React|from "react"|require\(|module\.exports|Vue\.component|new Vue|interface |type ')
+_REACT_MARKERS = frozenset((b'import React', b'from "react"'))
+
+_MMAP_THRESHOLD = 1024 * 1024
+_BUNDLE_SUFFIXES = ('.min.js', '.bundle.js')
+
 class JavaScriptScanner:
     pass
     
-    def __init__(self):
-        self.patterns = {
-            'import': re.compile(r'import\s+.*?\s+from\s+[\'"](.+?)[\'"]'),
-            'require': re.compile(r'require\([\'"](.+?)[\'"]\)'),
-            'function': re.compile(r'(?:function\s+(\w+)|const\s+(\w+)\s*=\s*(?:async\s+)?\([^)]*\)\s*=>|(\w+)\s*:\s*(?:async\s+)?\([^)]*\)\s*=>)'),
-            'class': re.compile(r'class\s+(\w+)'),
-            'const': re.compile(r'const\s+(\w+)'),
-            'let': re.compile(r'let\s+(\w+)'),
-            'var': re.compile(r'var\s+(\w+)'),
-            'export': re.compile(r'export\s+(?:default\s+)?(?:class|function|const)\s+(\w+)'),
-            'async': re.compile(r'async\s+function'),
-            'promise': re.compile(r'new\s+Promise|\.then\(|\.catch\(|await\s+'),
-            'comment_single': re.compile(r'//.*$', re.MULTILINE),
-            'comment_multi': re.compile(r'/\*.*?\*/', re.DOTALL),
-        }
+    def __init__(self, max_file_bytes: int = 2_000_000):
+        self.patterns = _PATTERNS
+        self.max_file_bytes = max_file_bytes
     
     def scan_file(self, file_path: str) -> Dict[str, Any]:
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            lines = content.split('\n')
-            total_lines = len(lines)
-            code_lines = self._count_code_lines(lines)
-            
-            imports = self._extract_imports(content)
-            functions = self._extract_functions(content)
-            classes = self._extract_classes(content)
-            exports = self._extract_exports(content)
-            
-            complexity = self._calculate_complexity(content)
-            
-            has_async = bool(self.patterns['async'].search(content))
-            has_promises = bool(self.patterns['promise'].search(content))
+            size = os.stat(file_path).st_size
+            # Bundled/minified output yields meaningless metrics at a huge cost
+            if size > self.max_file_bytes or file_path.endswith(_BUNDLE_SUFFIXES):
+                return {
+                    'path': file_path,
+                    'skipped': 'large_or_minified',
+                    'size': size
+                }
             
-            language = 'TypeScript' if file_path.endswith('.ts') or file_path.endswith('.tsx') else 'JavaScript'
-            
-            return {
-                'path': file_path,
-                'language': language,
-                'total_lines': total_lines,
-                'code_lines': code_lines,
-                'imports': imports,
-                'functions': functions,
-                'classes': classes,
-                'exports': exports,
-                'complexity': complexity,
-                'features': {
-                    'async': has_async,
-                    'promises': has_promises,
-                },
-                'type': self._detect_file_type(file_path, content)
-            }
+            with open(file_path, 'rb') as f:
+                if size >= _MMAP_THRESHOLD:
+                    # Bundles can be tens of MB; scan the page cache in place
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        return self._scan_content(file_path, content)
+                content = f.read()
+            return self._scan_content(file_path, content)
         
         except Exception as e:
             return {
@@ -65,103 +100,126 @@ class JavaScriptScanner:
                 'error': str(e)
             }
     
-    def _count_code_lines(self, lines: List[str]) -> int:
+    def _scan_content(self, file_path: str, content: Union[bytes, mmap.mmap]) -> Dict[str, Any]:
+        total_lines, code_lines = self._count_code_lines(content)
+        
+        imports, functions, classes, exports, complexity = self._scan_tokens(content)
+        
+        has_async = bool(self.patterns['async'].search(content))
+        has_promises = bool(self.patterns['promise'].search(content))
+        
+        language = 'TypeScript' if file_path.endswith('.ts') or file_path.endswith('.tsx') else 'JavaScript'
+        
+        return {
+            'path': file_path,
+            'language': language,
+            'total_lines': total_lines,
+            'code_lines': code_lines,
+            'imports': imports,
+            'functions': functions,
+            'classes': classes,
+            'exports': exports,
+            'complexity': complexity,
+            'features': {
+                'async': has_async,
+                'promises': has_promises,
+            },
+            'type': self._detect_file_type(file_path, content)
+        }
+    
+    def _count_code_lines(self, content: Union[bytes, mmap.mmap]) -> Tuple[int, int]:
         code_lines = 0
         in_multiline_comment = False
         
-        for line in lines:
+        is_mapped = isinstance(content, mmap.mmap)
+        if is_mapped:
+            content.seek(0)
+            lines = iter(content.readline, b'')
+        else:
+            lines = content.splitlines()
+        
+        line_count = 0
+        line = b'\n'
+        for line_count, line in enumerate(lines, 1):
             stripped = line.strip()
             
             if not stripped:
                 continue
             
-            if '/*' in stripped:
+            if b'/*' in stripped:
                 in_multiline_comment = True
-            if '*/' in stripped:
+            if b'*/' in stripped:
                 in_multiline_comment = False
                 continue
             
             if in_multiline_comment:
                 continue
             
-            if stripped.startswith('//'):
+            if stripped.startswith(b'//'):
                 continue
             
             code_lines += 1
         
-        return code_lines
-    
-    def _extract_imports(self, content: str) -> List[str]:
-        imports = []
-        
-        for match in self.patterns['import'].finditer(content):
-            imports.append(match.group(1))
+        if is_mapped:
+            # readline keeps the terminator, so a trailing newline opens one more line
+            total_lines = line_count + (line[-1:] == b'\n')
+        else:
+            total_lines = content.count(b'\n') + 1
         
-        for match in self.patterns['require'].finditer(content):
-            imports.append(match.group(1))
-        
-        return list(set(imports))  # Remove duplicates
+        return total_lines, code_lines
     
-    def _extract_functions(self, content: str) -> List[Dict[str, str]]:
+    def _scan_tokens(self, content: bytes) -> Tuple[List[str], List[Dict[str, str]], List[str], List[str], int]:
+        imports = {}  # dict keys dedupe while keeping source order
         functions = []
-        
-        for match in self.patterns['function'].finditer(content):
-            name = next((g for g in match.groups() if g is not None), None)
-            if name:
-                functions.append({
-                    'name': name,
-                    'type': 'function'
-                })
-        
-        return functions
-    
-    def _extract_classes(self, content: str) -> List[str]:
         classes = []
-        
-        for match in self.patterns['class'].finditer(content):
-            classes.append(match.group(1))
-        
-        return classes
-    
-    def _extract_exports(self, content: str) -> List[str]:
         exports = []
+        complexity = 1 + sum(1 for _ in _BRANCH_RE.finditer(content))  # Base complexity
         
-        for match in self.patterns['export'].finditer(content):
-            exports.append(match.group(1))
-        
-        return exports
-    
-    def _calculate_complexity(self, content: str) -> int:
-        complexity = 1  # Base complexity
-        
-        complexity_keywords = [
-            r'\bif\b', r'\belse\b', r'\bfor\b', r'\bwhile\b',
-            r'\bcase\b', r'\bcatch\b', r'\b\?\b', r'\b&&\b', r'\b\|\|\b'
-        ]
-        
-        for keyword in complexity_keywords:
-            complexity += len(re.findall(keyword, content))
-        
-        return complexity
+        for match in _TOKEN_RE.finditer(content):
+            kind = match.lastgroup
+            
+            if kind == 'function':
+                name = match['function_name'] or match['arrow_name'] or match['method_name']
+                functions.append({'name': name.decode('utf-8', 'ignore'), 'type': 'function'})
+            elif kind == 'class':
+                classes.append(match['class_name'].decode('utf-8', 'ignore'))
+            elif kind == 'import':
+                imports[match['import_name'].decode('utf-8', 'ignore')] = None
+            elif kind == 'require':
+                imports[match['require_name'].decode('utf-8', 'ignore')] = None
+            elif kind == 'export':
+                name = match['export_name'].decode('utf-8', 'ignore')
+                exports.append(name)
+                export_kind = match['export_kind']
+                if export_kind == b'class':
+                    classes.append(name)
+                elif export_kind == b'function' or match['export_arrow']:
+                    functions.append({'name': name, 'type': 'function'})
+        
+        return list(imports), functions, classes, exports, complexity
     
-    def _detect_file_type(self, file_path: str, content: str) -> str:
+    def _detect_file_type(self, file_path: str, content: bytes) -> str:
         path = Path(file_path)
         
         if '.jsx' in path.suffixes or '.tsx' in path.suffixes:
             return 'React Component'
         
-        if 'import React' in content or 'from "react"' in content:
-            return 'React Component'
+        found = set()
+        for match in _TYPE_RE.finditer(content):
+            marker = match.group()
+            if marker in _REACT_MARKERS:
+                return 'React Component'
+            found.add(marker)
         
-        if 'require(' in content and 'module.exports' in content:
+        if b'require(' in found and b'module.exports' in found:
             return 'Node.js Module'
         
-        if path.suffix in ['.ts', '.tsx']:
-            if 'interface ' in content or 'type ' in content:
+        if path.suffix == '.ts':
+            if b'interface ' in found or b'type ' in found:
                 return 'TypeScript with Types'
             return 'TypeScript'
         
-        if 'Vue.component' in content or 'new Vue' in content:
+        if b'Vue.component' in found or b'new Vue' in found:
             return 'Vue Component'
         
         return 'JavaScript Module'
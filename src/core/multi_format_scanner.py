@@ -1,12 +1,211 @@
 import re
 import json
+import mmap
+import heapq
 import os
-from typing import Dict, List, Any
+import threading
+from bisect import bisect_right
+from collections import Counter
+from typing import Dict, Iterable, List, Any, Set
 from dataclasses import dataclass
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+_INLINE_SCRIPT_PATTERNS = (
+    (re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE), 'Inline Script', 'HIGH'),
+    (re.compile(r'on\w+\s*=\s*["\']', re.IGNORECASE), 'Inline Event Handler', 'HIGH'),
+    (re.compile(r'javascript:', re.IGNORECASE), 'JavaScript Protocol', 'HIGH'),
+)
+
+_DANGEROUS_ATTR_PATTERNS = (
+    (re.compile(r'innerHTML\s*=', re.IGNORECASE), 'innerHTML Assignment', 'Use textContent or sanitize input'),
+    (re.compile(r'document\.write', re.IGNORECASE), 'document.write', 'Use modern DOM methods'),
+    (re.compile(r'eval\s*\(', re.IGNORECASE), 'eval() Usage', 'Never use eval() - code injection risk'),
+)
+
+# Literals that every pattern in a table requires; lines containing none of
+# them skip the regex engine entirely.
+_DANGEROUS_ATTR_KEYWORDS = ('innerhtml', 'document.write', 'eval')
+_SQL_INJECTION_KEYWORDS = ('EXEC', 'DROP', 'DELETE', '--')
+
+_INSECURE_RESOURCE_RE = re.compile(r'(src|href)\s*=\s*["\']http://', re.IGNORECASE)
+
+_SECRET_PATTERNS = (
+    (re.compile(r'AKIA[0-9A-Z]{16}'), 'AWS Access Key'),
+    (re.compile(r'sk-[a-zA-Z0-9]{32,}'), 'OpenAI API Key'),
+    (re.compile(r'ghp_[a-zA-Z0-9]{36,}'), 'GitHub Token'),
+    (re.compile(r'xox[a-zA-Z]-[a-zA-Z0-9-]+'), 'Slack Token'),
+)
+
+_SQL_INJECTION_PATTERNS = (
+    (re.compile(r'EXEC\s*\(', re.IGNORECASE), 'Dynamic SQL Execution'),
+    (re.compile(r'EXECUTE\s+IMMEDIATE', re.IGNORECASE), 'Dynamic SQL Execution'),
+    (re.compile(r';\s*DROP\s+TABLE', re.IGNORECASE), 'DROP TABLE Statement'),
+    (re.compile(r';\s*DELETE\s+FROM', re.IGNORECASE), 'DELETE Statement'),
+    (re.compile(r'--', re.IGNORECASE), 'SQL Comment (potential injection)'),
+)
+
+class _PatternSet:
+    pass
+    
+    def __init__(self, table, flags=0):
+        self.table = table
+        # Each alternative sits in its own zero-width lookahead, so a single
+        # finditer reports every table entry matching a line even when the
+        # matches overlap; the group name carries the entry's index.
+        self._regex = re.compile(
+            '|'.join(f'(?=(?P<p{i}>{entry[0].pattern}))' for i, entry in enumerate(table)), flags
+        )
+        self._db = self._compile_hyperscan(flags) if HYPERSCAN_AVAILABLE else None
+        self._local = threading.local()
+    
+    def _compile_hyperscan(self, flags):
+        # Hyperscan reports every pattern in one automaton pass and cannot
+        # backtrack, which keeps malformed markup from going quadratic.
+        hs_flags = hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+        if flags & re.IGNORECASE:
+            hs_flags |= hyperscan.HS_FLAG_CASELESS
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[entry[0].pattern.encode('utf-8') for entry in self.table],
+                ids=list(range(len(self.table))),
+                elements=len(self.table),
+                flags=[hs_flags] * len(self.table)
+            )
+            return db
+        except Exception:
+            return None
+    
+    def matched(self, line: str) -> list:
+        if self._db is not None:
+            hits = set()
+            scratch = getattr(self._local, 'scratch', None)
+            if scratch is None:
+                # Scratch space is per-thread; scanners are shared across threads
+                scratch = self._local.scratch = hyperscan.Scratch(self._db)
+            self._db.scan(
+                line.encode('utf-8'),
+                match_event_handler=lambda pattern_id, start, end, flags, context: hits.add(pattern_id),
+                scratch=scratch
+            )
+        else:
+            hits = {int(m.lastgroup[1:]) for m in self._regex.finditer(line)}
+        return [self.table[i] for i in sorted(hits)]
+    
+    def matched_lines(self, content: str, line_starts: List[int]):
+        # Whole-content counterpart of matched(): one finditer over the file,
+        # yielding (line number, line text, entries) for each line with hits.
+        hits = {}
+        for m in self._regex.finditer(content):
+            hits.setdefault(bisect_right(line_starts, m.start()), set()).add(int(m.lastgroup[1:]))
+        for line_no, indices in hits.items():
+            line = content[line_starts[line_no - 1]:line_starts[line_no] - 1]
+            yield line_no, line, [self.table[i] for i in sorted(indices)]
+
+class KeywordSet:
+    pass
+    
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(keywords)
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE:
+            # One automaton pass finds every keyword, overlapping ones included,
+            # instead of a separate substring search per keyword.
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+    
+    def found(self, text: str) -> Set[str]:
+        if self._automaton is not None:
+            return {keyword for _, keyword in self._automaton.iter(text)}
+        return {keyword for keyword in self.keywords if keyword in text}
+    
+    def any_in(self, text: str) -> bool:
+        if self._automaton is not None:
+            return next(self._automaton.iter(text), None) is not None
+        return any(keyword in text for keyword in self.keywords)
+
+_INLINE_SCRIPT_SET = _PatternSet(_INLINE_SCRIPT_PATTERNS, re.IGNORECASE)
+_DANGEROUS_ATTR_SET = _PatternSet(_DANGEROUS_ATTR_PATTERNS, re.IGNORECASE)
+_SECRET_SET = _PatternSet(_SECRET_PATTERNS)
+_SQL_INJECTION_SET = _PatternSet(_SQL_INJECTION_PATTERNS, re.IGNORECASE)
+
+_DANGEROUS_ATTR_GUARD = KeywordSet(_DANGEROUS_ATTR_KEYWORDS)
+_SQL_INJECTION_GUARD = KeywordSet(_SQL_INJECTION_KEYWORDS)
+_SENSITIVE_KEYS = KeywordSet(('password', 'secret', 'api_key', 'token', 'private_key', 'aws_access'))
+_HEADER_MARKERS = KeywordSet(('Content-Security-Policy', 'X-Frame-Options', '<iframe'))
+
+# These run over the whole file rather than per line, so whitespace
+# classes exclude '\n' to keep every match within a single line.
+_DROP_DATABASE_RE = re.compile(r'DROP[^\S\n]+DATABASE', re.IGNORECASE)
+_TRUNCATE_TABLE_RE = re.compile(r'TRUNCATE[^\S\n]+TABLE', re.IGNORECASE)
+_SELECT_STAR_RE = re.compile(r'SELECT[^\S\n]+\*[^\S\n]+FROM', re.IGNORECASE)
+_HARDCODED_PASSWORD_RE = re.compile(r'PASSWORD[^\S\n]*=[^\S\n]*[\'"][^\'"\n]+[\'"]', re.IGNORECASE)
+_PASSWORD_COLUMN_RE = re.compile(r'PASSWORD[^\S\n]*,[^\S\n]*VARCHAR', re.IGNORECASE)
+_GRANT_ALL_RE = re.compile(r'GRANT[^\S\n]+ALL', re.IGNORECASE)
+_TO_PUBLIC_RE = re.compile(r'TO[^\S\n]+PUBLIC', re.IGNORECASE)
+
+_NEWLINE_RE = re.compile('\n')
+
+def _line_starts(content: str) -> List[int]:
+    # Offset of each line's first character, plus a sentinel one past the end
+    # so line n always spans content[starts[n-1]:starts[n] - 1].
+    return [0] + [m.end() for m in _NEWLINE_RE.finditer(content)] + [len(content) + 1]
+
+def _matching_lines(regex, content: str, line_starts: List[int]):
+    # Yields (line number, line text) once per line holding a match
+    last = 0
+    for m in regex.finditer(content):
+        line_no = bisect_right(line_starts, m.start())
+        if line_no != last:
+            last = line_no
+            yield line_no, content[line_starts[line_no - 1]:line_starts[line_no] - 1]
+
+def _tagged_lines(kind: int, regex, content: str, line_starts: List[int]):
+    for line_no, line in _matching_lines(regex, content, line_starts):
+        yield line_no, kind, line
+
+def _merged_matching_lines(regexes, content: str, line_starts: List[int]):
+    # Yields (line number, pattern index, line text) ordered by line, then by
+    # pattern, as a per-line loop testing each pattern in turn reports them
+    return heapq.merge(*(_tagged_lines(kind, regex, content, line_starts)
+                         for kind, regex in enumerate(regexes)))
+
+_MMAP_THRESHOLD = 1024 * 1024
+
+def _read_text(file_path: str) -> str:
+    # Large files are decoded straight from the page cache rather than through
+    # the text layer's read buffer, so only the decoded copy is heap-allocated.
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            content = f.read().decode('utf-8')
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, 'utf-8')
+    if '\r' in content:
+        # Match text-mode universal newline handling
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+_SEVERITY_PENALTIES = {'CRITICAL': 20, 'HIGH': 10, 'MEDIUM': 5, 'LOW': 2}
+
 @dataclass
 class SecurityIssue:
     pass
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ('type', 'severity', 'description', 'line', 'code_snippet', 'recommendation')
     type: str
     severity: str
     description: str
@@ -24,50 +223,34 @@ class HTMLScanner:
         self.issues = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
+            content = _read_text(file_path)
+            lines = content.split('\n')
         except:
             return []
         
-        self._check_inline_scripts(lines, file_path)
-        self._check_dangerous_attributes(lines, file_path)
-        self._check_external_resources(lines, file_path)
-        self._check_form_security(lines, file_path)
-        self._check_iframe_usage(lines, file_path)
-        self._check_meta_tags(lines, file_path)
+        self._check_lines(content, lines, file_path)
+        self._check_meta_tags(content, file_path)
         
         return self.issues
     
-    def _check_inline_scripts(self, lines: List[str], file_path: str):
-        dangerous_patterns = [
-            (r'<script[^>]*>.*?</script>', 'Inline Script', 'HIGH'),
-            (r'on\w+\s*=\s*["\']', 'Inline Event Handler', 'HIGH'),
-            (r'javascript:', 'JavaScript Protocol', 'HIGH'),
-        ]
-        
-        for i, line in enumerate(lines, 1):
-            for pattern, issue_type, severity in dangerous_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    self.issues.append(SecurityIssue(
-                        type=issue_type,
-                        severity=severity,
-                        description=f'Found {issue_type.lower()} - potential XSS vector',
-                        line=i,
-                        code_snippet=line.strip()[:80],
-                        recommendation='Use Content Security Policy (CSP) and avoid inline scripts. Move to external .js files.'
-                    ))
-    
-    def _check_dangerous_attributes(self, lines: List[str], file_path: str):
-        dangerous_attrs = [
-            (r'innerHTML\s*=', 'innerHTML Assignment', 'Use textContent or sanitize input'),
-            (r'document\.write', 'document.write', 'Use modern DOM methods'),
-            (r'eval\s*\(', 'eval() Usage', 'Never use eval() - code injection risk'),
-        ]
-        
+    def _check_lines(self, content: str, lines: List[str], file_path: str):
+        # All per-line checks share one pass so the content is streamed once
+        line_starts = None
         for i, line in enumerate(lines, 1):
-            for pattern, issue_type, recommendation in dangerous_attrs:
-                if re.search(pattern, line, re.IGNORECASE):
+            low = line.lower()
+            
+            for _, issue_type, severity in _INLINE_SCRIPT_SET.matched(line):
+                self.issues.append(SecurityIssue(
+                    type=issue_type,
+                    severity=severity,
+                    description=f'Found {issue_type.lower()} - potential XSS vector',
+                    line=i,
+                    code_snippet=line.strip()[:80],
+                    recommendation='Use Content Security Policy (CSP) and avoid inline scripts. Move to external .js files.'
+                ))
+            
+            if _DANGEROUS_ATTR_GUARD.any_in(low):
+                for _, issue_type, recommendation in _DANGEROUS_ATTR_SET.matched(line):
                     self.issues.append(SecurityIssue(
                         type=issue_type,
                         severity='HIGH',
@@ -76,10 +259,8 @@ class HTMLScanner:
                         code_snippet=line.strip()[:80],
                         recommendation=recommendation
                     ))
-    
-    def _check_external_resources(self, lines: List[str], file_path: str):
-        for i, line in enumerate(lines, 1):
-            if re.search(r'(src|href)\s*=\s*["\']http://', line, re.IGNORECASE):
+            
+            if 'http://' in low and _INSECURE_RESOURCE_RE.search(line):
                 self.issues.append(SecurityIssue(
                     type='Insecure Resource',
                     severity='MEDIUM',
@@ -89,7 +270,7 @@ class HTMLScanner:
                     recommendation='Use HTTPS for all external resources to prevent MITM attacks'
                 ))
             
-            if 'cdn' in line.lower() and 'integrity=' not in line:
+            if 'cdn' in low and 'integrity=' not in line:
                 self.issues.append(SecurityIssue(
                     type='Missing SRI',
                     severity='MEDIUM',
@@ -98,13 +279,14 @@ class HTMLScanner:
                     code_snippet=line.strip()[:80],
                     recommendation='Add integrity and crossorigin attributes for CDN resources'
                 ))
-    
-    def _check_form_security(self, lines: List[str], file_path: str):
-        for i, line in enumerate(lines, 1):
-            if '<form' in line.lower():
-                form_block = '\n'.join(lines[i-1:min(i+10, len(lines))])
+            
+            if '<form' in low:
+                if line_starts is None:
+                    line_starts = _line_starts(content)
+                form_block = content[line_starts[i-1]:line_starts[min(i+10, len(lines))] - 1]
+                form_lower = form_block.lower()
                 
-                if 'action=' in form_block and 'csrf' not in form_block.lower():
+                if 'action=' in form_block and 'csrf' not in form_lower:
                     self.issues.append(SecurityIssue(
                         type='Missing CSRF Protection',
                         severity='HIGH',
@@ -114,7 +296,7 @@ class HTMLScanner:
                         recommendation='Add CSRF token to all forms that modify data'
                     ))
                 
-                if 'password' in form_block.lower() and 'autocomplete="off"' not in form_block:
+                if 'password' in form_lower and 'autocomplete="off"' not in form_block:
                     self.issues.append(SecurityIssue(
                         type='Autocomplete on Password',
                         severity='LOW',
@@ -123,10 +305,8 @@ class HTMLScanner:
                         code_snippet=line.strip()[:80],
                         recommendation='Add autocomplete="off" to sensitive fields'
                     ))
-    
-    def _check_iframe_usage(self, lines: List[str], file_path: str):
-        for i, line in enumerate(lines, 1):
-            if '<iframe' in line.lower():
+            
+            if '<iframe' in low:
                 if 'sandbox=' not in line:
                     self.issues.append(SecurityIssue(
                         type='Unsafe iframe',
@@ -137,10 +317,10 @@ class HTMLScanner:
                         recommendation='Add sandbox attribute to restrict iframe capabilities'
                     ))
     
-    def _check_meta_tags(self, lines: List[str], file_path: str):
-        content = '\n'.join(lines)
+    def _check_meta_tags(self, content: str, file_path: str):
+        markers = _HEADER_MARKERS.found(content)
         
-        if 'Content-Security-Policy' not in content:
+        if 'Content-Security-Policy' not in markers:
             self.issues.append(SecurityIssue(
                 type='Missing CSP',
                 severity='MEDIUM',
@@ -150,7 +330,7 @@ class HTMLScanner:
                 recommendation='Add CSP meta tag to prevent XSS: <meta http-equiv="Content-Security-Policy" content="default-src \'self\'">'
             ))
         
-        if 'X-Frame-Options' not in content and '<iframe' in content:
+        if 'X-Frame-Options' not in markers and '<iframe' in markers:
             self.issues.append(SecurityIssue(
                 type='Missing X-Frame-Options',
                 severity='MEDIUM',
@@ -170,58 +350,56 @@ class JSONScanner:
         self.issues = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = _read_text(file_path)
         except:
             return []
         
+        line_starts = _line_starts(content)
+        
         try:
             data = json.loads(content)
             self._check_sensitive_data(data, file_path)
-            self._check_structure(data, file_path)
+            self._check_structure(data, len(content))
         except json.JSONDecodeError as e:
             self.issues.append(SecurityIssue(
                 type='JSON Syntax Error',
                 severity='CRITICAL',
                 description=f'Invalid JSON: {e.msg}',
                 line=e.lineno,
-                code_snippet=content.split('\n')[e.lineno-1] if e.lineno <= len(content.split('\n')) else '',
+                code_snippet=content[line_starts[e.lineno-1]:line_starts[e.lineno] - 1] if e.lineno < len(line_starts) else '',
                 recommendation=f'Fix JSON syntax at line {e.lineno}, column {e.colno}'
             ))
         
-        self._check_secrets(content, file_path)
+        self._check_secrets(content, line_starts)
         
         return self.issues
     
     def _check_sensitive_data(self, data: Any, file_path: str):
-        sensitive_keys = ['password', 'secret', 'api_key', 'token', 'private_key', 'aws_access']
-        
-        def check_dict(d, path=''):
-            if isinstance(d, dict):
-                for key, value in d.items():
-                    current_path = f"{path}.{key}" if path else key
-                    
-                    for sensitive in sensitive_keys:
-                        if sensitive in key.lower():
-                            self.issues.append(SecurityIssue(
-                                type='Sensitive Data Exposure',
-                                severity='HIGH',
-                                description=f'Sensitive key "{key}" found in JSON',
-                                line=1,
-                                code_snippet=f'"{key}": "{str(value)[:30]}..."',
-                                recommendation='Never store secrets in JSON config files. Use environment variables or secure vaults.'
-                            ))
-                    
-                    check_dict(value, current_path)
-            elif isinstance(d, list):
-                for item in d:
-                    check_dict(item, path)
-        
-        check_dict(data)
+        # Explicit stack instead of recursion; reversed pushes keep the
+        # original depth-first, document order of issues.
+        stack = [(None, data)]
+        while stack:
+            key, node = stack.pop()
+            
+            if key is not None:
+                for _ in _SENSITIVE_KEYS.found(key.lower()):
+                    self.issues.append(SecurityIssue(
+                        type='Sensitive Data Exposure',
+                        severity='HIGH',
+                        description=f'Sensitive key "{key}" found in JSON',
+                        line=1,
+                        code_snippet=f'"{key}": "{str(node)[:30]}..."',
+                        recommendation='Never store secrets in JSON config files. Use environment variables or secure vaults.'
+                    ))
+            
+            if isinstance(node, dict):
+                stack.extend(reversed(node.items()))
+            elif isinstance(node, list):
+                stack.extend((None, item) for item in reversed(node))
     
-    def _check_structure(self, data: Any, file_path: str):
+    def _check_structure(self, data: Any, content_len: int):
         if isinstance(data, dict):
-            if len(str(data)) > 1000000:  # 1MB
+            if content_len > 1000000:  # 1MB
                 self.issues.append(SecurityIssue(
                     type='Large JSON Object',
                     severity='LOW',
@@ -231,26 +409,17 @@ class JSONScanner:
                     recommendation='Consider splitting into smaller files or using database'
                 ))
     
-    def _check_secrets(self, content: str, file_path: str):
-        secret_patterns = [
-            (r'AKIA[0-9A-Z]{16}', 'AWS Access Key'),
-            (r'sk-[a-zA-Z0-9]{32,}', 'OpenAI API Key'),
-            (r'ghp_[a-zA-Z0-9]{36,}', 'GitHub Token'),
-            (r'xox[a-zA-Z]-[a-zA-Z0-9-]+', 'Slack Token'),
-        ]
-        
-        lines = content.split('\n')
-        for i, line in enumerate(lines, 1):
-            for pattern, secret_type in secret_patterns:
-                if re.search(pattern, line):
-                    self.issues.append(SecurityIssue(
-                        type='Hardcoded Secret',
-                        severity='CRITICAL',
-                        description=f'{secret_type} found in JSON file',
-                        line=i,
-                        code_snippet=line.strip()[:60] + '...',
-                        recommendation='Remove secret immediately. Use environment variables or secret management.'
-                    ))
+    def _check_secrets(self, content: str, line_starts: List[int]):
+        for i, line, matches in _SECRET_SET.matched_lines(content, line_starts):
+            for _, secret_type in matches:
+                self.issues.append(SecurityIssue(
+                    type='Hardcoded Secret',
+                    severity='CRITICAL',
+                    description=f'{secret_type} found in JSON file',
+                    line=i,
+                    code_snippet=line.strip()[:60] + '...',
+                    recommendation='Remove secret immediately. Use environment variables or secret management.'
+                ))
 
 class SQLScanner:
     pass
@@ -262,43 +431,39 @@ class SQLScanner:
         self.issues = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
+            content = _read_text(file_path)
+            lines = content.split('\n')
         except:
             return []
         
+        line_starts = _line_starts(content)
+        
         self._check_sql_injection_patterns(lines, file_path)
-        self._check_dangerous_operations(lines, file_path)
-        self._check_authentication(lines, file_path)
-        self._check_permissions(lines, file_path)
+        self._check_dangerous_operations(content, line_starts)
+        self._check_authentication(content, line_starts)
+        self._check_permissions(content, line_starts)
         
         return self.issues
     
     def _check_sql_injection_patterns(self, lines: List[str], file_path: str):
-        dangerous_patterns = [
-            (r'EXEC\s*\(', 'Dynamic SQL Execution'),
-            (r'EXECUTE\s+IMMEDIATE', 'Dynamic SQL Execution'),
-            (r';\s*DROP\s+TABLE', 'DROP TABLE Statement'),
-            (r';\s*DELETE\s+FROM', 'DELETE Statement'),
-            (r'--', 'SQL Comment (potential injection)'),
-        ]
-        
         for i, line in enumerate(lines, 1):
-            for pattern, issue_type in dangerous_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    self.issues.append(SecurityIssue(
-                        type=issue_type,
-                        severity='HIGH',
-                        description=f'Potentially dangerous SQL pattern: {issue_type}',
-                        line=i,
-                        code_snippet=line.strip()[:80],
-                        recommendation='Use parameterized queries. Never concatenate user input in SQL.'
-                    ))
+            upper = line.upper()
+            if not _SQL_INJECTION_GUARD.any_in(upper):
+                continue
+            for _, issue_type in _SQL_INJECTION_SET.matched(line):
+                self.issues.append(SecurityIssue(
+                    type=issue_type,
+                    severity='HIGH',
+                    description=f'Potentially dangerous SQL pattern: {issue_type}',
+                    line=i,
+                    code_snippet=line.strip()[:80],
+                    recommendation='Use parameterized queries. Never concatenate user input in SQL.'
+                ))
     
-    def _check_dangerous_operations(self, lines: List[str], file_path: str):
-        for i, line in enumerate(lines, 1):
-            if re.search(r'DROP\s+DATABASE', line, re.IGNORECASE):
+    def _check_dangerous_operations(self, content: str, line_starts: List[int]):
+        patterns = (_DROP_DATABASE_RE, _TRUNCATE_TABLE_RE, _SELECT_STAR_RE)
+        for i, kind, line in _merged_matching_lines(patterns, content, line_starts):
+            if kind == 0:
                 self.issues.append(SecurityIssue(
                     type='DROP DATABASE',
                     severity='CRITICAL',
@@ -307,8 +472,7 @@ class SQLScanner:
                     code_snippet=line.strip(),
                     recommendation='Ensure this is intentional and has proper safeguards'
                 ))
-            
-            if re.search(r'TRUNCATE\s+TABLE', line, re.IGNORECASE):
+            elif kind == 1:
                 self.issues.append(SecurityIssue(
                     type='TRUNCATE TABLE',
                     severity='HIGH',
@@ -317,8 +481,7 @@ class SQLScanner:
                     code_snippet=line.strip(),
                     recommendation='Ensure backup exists before truncating'
                 ))
-            
-            if re.search(r'SELECT\s+\*\s+FROM', line, re.IGNORECASE):
+            else:
                 self.issues.append(SecurityIssue(
                     type='SELECT *',
                     severity='LOW',
@@ -328,9 +491,10 @@ class SQLScanner:
                     recommendation='Explicitly list required columns instead of SELECT *'
                 ))
     
-    def _check_authentication(self, lines: List[str], file_path: str):
-        for i, line in enumerate(lines, 1):
-            if re.search(r'PASSWORD\s*=\s*[\'"][^\'"]+[\'"]', line, re.IGNORECASE):
+    def _check_authentication(self, content: str, line_starts: List[int]):
+        patterns = (_HARDCODED_PASSWORD_RE, _PASSWORD_COLUMN_RE)
+        for i, kind, line in _merged_matching_lines(patterns, content, line_starts):
+            if kind == 0:
                 self.issues.append(SecurityIssue(
                     type='Hardcoded Password',
                     severity='CRITICAL',
@@ -339,9 +503,9 @@ class SQLScanner:
                     code_snippet='PASSWORD = \'***\'',
                     recommendation='Use environment variables or secure configuration'
                 ))
-            
-            if re.search(r'PASSWORD\s*,\s*VARCHAR', line, re.IGNORECASE):
-                if 'HASH' not in line.upper() and 'ENCRYPT' not in line.upper():
+            else:
+                upper = line.upper()
+                if 'HASH' not in upper and 'ENCRYPT' not in upper:
                     self.issues.append(SecurityIssue(
                         type='Plain Text Password Storage',
                         severity='CRITICAL',
@@ -351,9 +515,10 @@ class SQLScanner:
                         recommendation='Always hash passwords (bcrypt, Argon2). Never store plain text.'
                     ))
     
-    def _check_permissions(self, lines: List[str], file_path: str):
-        for i, line in enumerate(lines, 1):
-            if re.search(r'GRANT\s+ALL', line, re.IGNORECASE):
+    def _check_permissions(self, content: str, line_starts: List[int]):
+        patterns = (_GRANT_ALL_RE, _TO_PUBLIC_RE)
+        for i, kind, line in _merged_matching_lines(patterns, content, line_starts):
+            if kind == 0:
                 self.issues.append(SecurityIssue(
                     type='Excessive Permissions',
                     severity='HIGH',
@@ -362,8 +527,7 @@ class SQLScanner:
                     code_snippet=line.strip(),
                     recommendation='Grant only necessary permissions (principle of least privilege)'
                 ))
-            
-            if re.search(r'TO\s+PUBLIC', line, re.IGNORECASE):
+            else:
                 self.issues.append(SecurityIssue(
                     type='Public Access',
                     severity='HIGH',
@@ -380,6 +544,12 @@ class MultiFormatScanner:
         self.html_scanner = HTMLScanner()
         self.json_scanner = JSONScanner()
         self.sql_scanner = SQLScanner()
+        self._dispatch = {
+            '.html': (self.html_scanner, 'HTML'),
+            '.htm': (self.html_scanner, 'HTML'),
+            '.json': (self.json_scanner, 'JSON'),
+            '.sql': (self.sql_scanner, 'SQL'),
+        }
     
     def scan_file(self, file_path: str) -> Dict[str, Any]:
         ext = os.path.splitext(file_path)[1].lower()
@@ -387,15 +557,9 @@ class MultiFormatScanner:
         issues = []
         file_type = 'unknown'
         
-        if ext in ['.html', '.htm']:
-            issues = self.html_scanner.scan(file_path)
-            file_type = 'HTML'
-        elif ext == '.json':
-            issues = self.json_scanner.scan(file_path)
-            file_type = 'JSON'
-        elif ext == '.sql':
-            issues = self.sql_scanner.scan(file_path)
-            file_type = 'SQL'
+        if ext in self._dispatch:
+            scanner, file_type = self._dispatch[ext]
+            issues = scanner.scan(file_path)
         
         issues_dict = [
             {
@@ -409,16 +573,8 @@ class MultiFormatScanner:
             for i in issues
         ]
         
-        score = 100.0
-        for issue in issues:
-            if issue.severity == 'CRITICAL':
-                score -= 20
-            elif issue.severity == 'HIGH':
-                score -= 10
-            elif issue.severity == 'MEDIUM':
-                score -= 5
-            elif issue.severity == 'LOW':
-                score -= 2
+        severity_counts = Counter(issue.severity for issue in issues)
+        score = 100.0 - sum(_SEVERITY_PENALTIES.get(severity, 0) * count for severity, count in severity_counts.items())
         score = max(0, score)
         
         return {
@@ -426,13 +582,12 @@ class MultiFormatScanner:
             'total_issues': len(issues),
             'issues': issues_dict,
             'score': round(score, 1),
-            'by_severity': self._count_by_severity(issues)
+            'by_severity': self._count_by_severity(severity_counts)
         }
     
-    def _count_by_severity(self, issues: List[SecurityIssue]) -> Dict[str, int]:
+    def _count_by_severity(self, severity_counts: Counter) -> Dict[str, int]:
         counts = {'CRITICAL': 0, 'HIGH': 0, 'MEDIUM': 0, 'LOW': 0}
-        for issue in issues:
-            counts[issue.severity] = counts.get(issue.severity, 0) + 1
+        counts.update(severity_counts)
         return counts
 
 if __name__ == '__main__':
@@ -1,167 +1,371 @@
+import ast
 import multiprocessing
+import os
+import re
+from collections import Counter
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Any, Callable
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, List, Dict, Any, Callable, Optional, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 import logging
 
+from .js_scanner import JavaScriptScanner
+from .multi_format_scanner import KeywordSet
+
 logger = logging.getLogger(__name__)
 
+_LANGUAGE_MAP = {
+    '.py': 'Python', '.pyw': 'Python',
+    '.js': 'JavaScript', '.jsx': 'JavaScript', '.mjs': 'JavaScript',
+    '.ts': 'TypeScript', '.tsx': 'TypeScript',
+    '.java': 'Java',
+    '.cpp': 'C++', '.cc': 'C++', '.cxx': 'C++', '.hpp': 'C++', '.h': 'C/C++',
+    '.c': 'C',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.rb': 'Ruby',
+    '.php': 'PHP',
+    '.swift': 'Swift',
+    '.kt': 'Kotlin', '.kts': 'Kotlin',
+    '.cs': 'C#',
+    '.scala': 'Scala',
+    '.r': 'R',
+    '.dart': 'Dart',
+    '.lua': 'Lua',
+    '.sh': 'Shell', '.bash': 'Shell',
+    '.sql': 'SQL',
+    '.html': 'HTML', '.htm': 'HTML',
+    '.css': 'CSS', '.scss': 'CSS', '.sass': 'CSS',
+    '.json': 'JSON',
+    '.yaml': 'YAML', '.yml': 'YAML',
+    '.xml': 'XML',
+    '.md': 'Markdown'
+}
+
+_SMALL_FILE_BYTES = 64 * 1024
+_MIN_PARALLEL_FILES = 8
+
+_MODES = ('auto', 'thread', 'process')
+
+_PASSWORD_ASSIGN_RE = re.compile(r'password\s*=\s*["\']', re.IGNORECASE)
+_NON_EMPTY_LINE_RE = re.compile(r'^[^\S\n]*\S', re.MULTILINE)
+_CODE_MARKERS = KeywordSet(('eval(', 'exec('))
+
+# One alternation per language; each named group is a counted definition kind,
+# so a single finditer pass replaces a findall per kind.
+_JAVA_DEFINITIONS_RE = re.compile(
+    r'(?P<classes>\b(?:public|private|protected)?\s*class\s+\w+)'
+    r'|(?P<methods>\b(?:public|private|protected)\s+(?:static\s+)?[\w<>\[\]]+\s+\w+\s*\()'
+    r'|(?P<imports>\bimport\s+)'
+)
+_C_DEFINITIONS_RE = re.compile(
+    r'(?P<functions>\b[\w:]+\s+\w+\s*\([^)]*\)\s*\{)'
+    r'|(?P<classes>\bclass\s+\w+)'
+    r'|(?P<includes>#include\s*[<"])'
+)
+_GO_DEFINITIONS_RE = re.compile(
+    r'(?P<functions>\bfunc\s+\w+)'
+    r'|(?P<structs>\btype\s+\w+\s+struct)'
+    r'|(?P<imports>\bimport\s+)'
+)
+_RUST_DEFINITIONS_RE = re.compile(
+    r'(?P<functions>\bfn\s+\w+)'
+    r'|(?P<structs>\bstruct\s+\w+)'
+    r'|(?P<traits>\btrait\s+\w+)'
+)
+_DEFINITION_RES = {
+    '.java': _JAVA_DEFINITIONS_RE,
+    '.c': _C_DEFINITIONS_RE, '.cpp': _C_DEFINITIONS_RE, '.cc': _C_DEFINITIONS_RE,
+    '.cxx': _C_DEFINITIONS_RE, '.h': _C_DEFINITIONS_RE, '.hpp': _C_DEFINITIONS_RE,
+    '.go': _GO_DEFINITIONS_RE,
+    '.rs': _RUST_DEFINITIONS_RE,
+}
+
+_js_scanner = None
+
+
+def _init_worker():
+    # Runs once per worker process; every task in it reuses the same scanner
+    _shared_js_scanner()
+
+
+def _shared_js_scanner() -> JavaScriptScanner:
+    # The scanner is stateless, so threads in the parent share one as well;
+    # a racing first call just builds a spare.
+    global _js_scanner
+    if _js_scanner is None:
+        _js_scanner = JavaScriptScanner()
+    return _js_scanner
+
+
+class _PythonCounter(ast.NodeVisitor):
+    
+    def __init__(self):
+        self.functions = 0
+        self.classes = 0
+        self.imports = 0
+    
+    def visit_FunctionDef(self, node):
+        self.functions += 1
+        self.generic_visit(node)
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+    
+    def visit_ClassDef(self, node):
+        self.classes += 1
+        self.generic_visit(node)
+    
+    def visit_Import(self, node):
+        self.imports += 1
+    
+    visit_ImportFrom = visit_Import
+
 
 class ParallelScanner:
     
-    def __init__(self, max_workers=None):
+    def __init__(self, max_workers=None, small_file_bytes: int = _SMALL_FILE_BYTES, mode: str = 'auto',
+                 min_parallel_files: int = _MIN_PARALLEL_FILES):
+        if mode not in _MODES:
+            raise ValueError(f"mode must be one of {_MODES}, got {mode!r}")
         self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.small_file_bytes = small_file_bytes
+        # 'auto' routes by file size; 'thread' suits I/O-bound analyzers and
+        # 'process' pure-Python ones that would otherwise serialize on the GIL.
+        self.mode = mode
+        self.min_parallel_files = min_parallel_files
+        # Started on first use and reused by every later scan_files call
+        self._threads = None
+        self._processes = None
         logger.info(f"Initialized parallel scanner with {self.max_workers} workers")
     
-    def scan_files(self, files: List[Path], analyzer_func: Callable) -> List[Dict[str, Any]]:
-        results = []
+    def __getstate__(self) -> Dict[str, Any]:
+        # Executors cannot cross process boundaries; a copy starts without them.
+        state = self.__dict__.copy()
+        state['_threads'] = None
+        state['_processes'] = None
+        return state
+    
+    def __enter__(self) -> 'ParallelScanner':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=self.max_workers * 2)
+        return self._threads
+    
+    def _process_pool(self) -> ProcessPoolExecutor:
+        if self._processes is None:
+            self._processes = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker)
+        return self._processes
+    
+    def close(self):
+        for pool in (self._threads, self._processes):
+            if pool is not None:
+                pool.shutdown()
+        self._threads = None
+        self._processes = None
+    
+    def _drop_process_pool(self, error: Exception):
+        logger.warning(f"Process pool failed, finishing on threads: {error!r}")
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+            self._processes = None
+    
+    def _start_processes(self, task: Callable, files: List[Any], chunksize: int) -> Iterator[Dict[str, Any]]:
+        try:
+            return self._process_pool().map(task, files, chunksize=chunksize)
+        except Exception as e:
+            self._drop_process_pool(e)
+            return iter(())
+    
+    def _finish_processes(self, pooled: Iterator[Dict[str, Any]], task: Callable,
+                          files: List[Any]) -> Iterator[Dict[str, Any]]:
+        # _run_analyzer already turns analyzer errors into records, so anything
+        # raised here is the pool itself (a dead worker, an unpicklable task);
+        # the files it did not return are analysed on threads instead.
+        done = 0
+        try:
+            for result in pooled:
+                yield result
+                done += 1
+        except Exception as e:
+            self._drop_process_pool(e)
+        if done < len(files):
+            yield from self._thread_pool().map(task, files[done:])
+    
+    def map_io(self, func: Callable, items: List[Any]) -> List[Any]:
+        # For I/O-bound helpers such as hashing: reads and digests release the
+        # GIL, so the shared threads overlap them.
+        if len(items) <= self.min_parallel_files:
+            return [func(item) for item in items]
+        return list(self._thread_pool().map(func, items))
+    
+    def _split_by_size(self, files: List[Path],
+                       sizes: Optional[Sequence[Optional[int]]] = None) -> Tuple[List[int], List[int]]:
+        if self.mode == 'thread':
+            return list(range(len(files))), []
+        
+        small, large = [], []
+        for index, file in enumerate(files):
+            size = sizes[index] if sizes is not None else None
+            if size is None:
+                try:
+                    size = os.stat(file).st_size
+                except OSError:
+                    # Let the analyzer report the failure; it is cheap either way
+                    size = 0
+            if self.mode == 'auto' and size < self.small_file_bytes:
+                small.append(index)
+            else:
+                large.append((size, index))
+        # Biggest first, so no long parse starts last and sets the wall time
+        large.sort(reverse=True)
+        return small, [index for _, index in large]
+    
+    def _deal_chunks(self, large: List[int], chunksize: int) -> List[int]:
+        # map() hands out consecutive runs of chunksize; dealing the sorted
+        # files round-robin gives every chunk a similar mix of sizes while
+        # the heaviest chunks are still queued first. The smallest leftovers
+        # form the final, short chunk.
+        chunks = len(large) // chunksize
+        dealt = large[:chunks * chunksize]
+        return [index for start in range(chunks) for index in dealt[start::chunks]] + large[chunks * chunksize:]
+    
+    def scan_files(self, files: List[Path], analyzer_func: Callable,
+                   on_result: Optional[Callable[[Any, Dict[str, Any]], None]] = None,
+                   sizes: Optional[Sequence[Optional[int]]] = None) -> List[Dict[str, Any]]:
+        # sizes, aligned with files, spares a stat per file when the caller
+        # already has them; None entries are stat-ed here.
         total_files = len(files)
+        results = [None] * total_files
+        
+        task = partial(_run_analyzer, analyzer_func)
+        
+        # A handful of files finishes before a pool could even hand them out
+        if total_files <= self.min_parallel_files:
+            logger.info(f"Scanning {total_files} files inline")
+            for index, file in enumerate(files):
+                results[index] = task(file)
+                if on_result is not None:
+                    on_result(file, results[index])
+            return results
         
         logger.info(f"Scanning {total_files} files using {self.max_workers} workers")
         
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_file = {
-                executor.submit(analyzer_func, file): file 
-                for file in files
-            }
+        # Small files are dominated by I/O and would spend as long being
+        # pickled to a worker process as being analysed, so they run on
+        # threads; only large files, where parsing dominates, go to processes.
+        small, large = self._split_by_size(files, sizes)
+        logger.debug(f"{len(small)} small files on threads, {len(large)} large files on processes")
+        
+        # Large chunks amortise the pickling round-trip per task; four chunks
+        # per worker still leaves room to balance uneven file sizes.
+        chunksize = max(1, len(large) // (self.max_workers * 4))
+        large = self._deal_chunks(large, chunksize)
+        
+        large_files = [files[i] for i in large]
+        large_results = self._finish_processes(
+            self._start_processes(task, large_files, chunksize), task, large_files
+        ) if large else ()
+        small_results = self._thread_pool().map(task, [files[i] for i in small]) if small else ()
+        
+        for completed, (index, result) in enumerate(
+            chain(zip(small, small_results), zip(large, large_results)), 1
+        ):
+            results[index] = result
+            if on_result is not None:
+                on_result(files[index], result)
             
-            completed = 0
-            for future in as_completed(future_to_file):
-                file = future_to_file[future]
-                completed += 1
-                
-                try:
-                    result = future.result()
-                    results.append(result)
-                    
-                    if completed % 10 == 0 or completed == total_files:
-                        logger.debug(f"Progress: {completed}/{total_files} files")
-                        
-                except Exception as e:
-                    logger.error(f"Error analyzing {file}: {e}")
-                    results.append({
-                        'file': str(file),
-                        'error': str(e),
-                        'status': 'failed'
-                    })
+            if completed % 10 == 0 or completed == total_files:
+                logger.debug(f"Progress: {completed}/{total_files} files")
         
         logger.info(f"Completed scanning {total_files} files")
         return results
 
 
+def _run_analyzer(analyzer_func: Callable, file) -> Dict[str, Any]:
+    try:
+        return analyzer_func(file)
+    except Exception as e:
+        logger.error(f"Error analyzing {file}: {e}")
+        return {
+            'file': str(file),
+            'error': str(e),
+            'status': 'failed'
+        }
+
+
 def analyze_file_wrapper(file_path):
-    from pathlib import Path
-    import re
-    
     try:
-        file_path = Path(file_path)
-        ext = file_path.suffix.lower()
+        # Plain strings end to end; a Path per file adds up on large scans
+        file_path = os.fspath(file_path)
+        ext = os.path.splitext(file_path)[1].lower()
         
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
             code = f.read()
         
-        lines = code.split('\n')
-        non_empty_lines = [l for l in lines if l.strip()]
-        
-        language_map = {
-            '.py': 'Python', '.pyw': 'Python',
-            '.js': 'JavaScript', '.jsx': 'JavaScript', '.mjs': 'JavaScript',
-            '.ts': 'TypeScript', '.tsx': 'TypeScript',
-            '.java': 'Java',
-            '.cpp': 'C++', '.cc': 'C++', '.cxx': 'C++', '.hpp': 'C++', '.h': 'C/C++',
-            '.c': 'C',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.rb': 'Ruby',
-            '.php': 'PHP',
-            '.swift': 'Swift',
-            '.kt': 'Kotlin', '.kts': 'Kotlin',
-            '.cs': 'C#',
-            '.scala': 'Scala',
-            '.r': 'R',
-            '.dart': 'Dart',
-            '.lua': 'Lua',
-            '.sh': 'Shell', '.bash': 'Shell',
-            '.sql': 'SQL',
-            '.html': 'HTML', '.htm': 'HTML',
-            '.css': 'CSS', '.scss': 'CSS', '.sass': 'CSS',
-            '.json': 'JSON',
-            '.yaml': 'YAML', '.yml': 'YAML',
-            '.xml': 'XML',
-            '.md': 'Markdown'
-        }
+        # Same counts as split('\n') and strip(), without building the lists
+        total_lines = code.count('\n') + 1
+        code_lines = len(_NON_EMPTY_LINE_RE.findall(code))
+        size = len(code)
         
-        language = language_map.get(ext, 'Unknown')
+        language = _LANGUAGE_MAP.get(ext, 'Unknown')
         
         result = {
-            'file': str(file_path),
+            'file': file_path,
             'language': language,
-            'total_lines': len(lines),
-            'code_lines': len(non_empty_lines),
-            'size': len(code),
+            'total_lines': total_lines,
+            'code_lines': code_lines,
+            'size': size,
             'extension': ext
         }
         
         if ext == '.py':
             try:
-                import ast
-                tree = ast.parse(code)
+                counter = _PythonCounter()
+                counter.visit(ast.parse(code))
                 result.update({
-                    'functions': len([n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)]),
-                    'classes': len([n for n in ast.walk(tree) if isinstance(n, ast.ClassDef)]),
-                    'imports': len([n for n in ast.walk(tree) if isinstance(n, (ast.Import, ast.ImportFrom))]),
+                    'functions': counter.functions,
+                    'classes': counter.classes,
+                    'imports': counter.imports,
                 })
             except:
                 pass
         
         elif ext in ['.js', '.jsx', '.ts', '.tsx']:
-            result.update({
-                'functions': len(re.findall(r'\bfunction\s+\w+|\b\w+\s*=\s*(?:async\s+)?(?:function|\(.*?\)\s*=>)', code)),
-                'classes': len(re.findall(r'\bclass\s+\w+', code)),
-                'imports': len(re.findall(r'\bimport\s+.*?from|require\(', code)),
-            })
-        
-        elif ext == '.java':
-            result.update({
-                'classes': len(re.findall(r'\b(?:public|private|protected)?\s*class\s+\w+', code)),
-                'methods': len(re.findall(r'\b(?:public|private|protected)\s+(?:static\s+)?[\w<>\[\]]+\s+\w+\s*\(', code)),
-                'imports': len(re.findall(r'\bimport\s+', code)),
-            })
-        
-        elif ext in ['.c', '.cpp', '.cc', '.cxx', '.h', '.hpp']:
-            result.update({
-                'functions': len(re.findall(r'\b[\w:]+\s+\w+\s*\([^)]*\)\s*\{', code)),
-                'classes': len(re.findall(r'\bclass\s+\w+', code)),
-                'includes': len(re.findall(r'#include\s*[<"]', code)),
-            })
-        
-        elif ext == '.go':
-            result.update({
-                'functions': len(re.findall(r'\bfunc\s+\w+', code)),
-                'structs': len(re.findall(r'\btype\s+\w+\s+struct', code)),
-                'imports': len(re.findall(r'\bimport\s+', code)),
-            })
-        
-        elif ext == '.rs':
-            result.update({
-                'functions': len(re.findall(r'\bfn\s+\w+', code)),
-                'structs': len(re.findall(r'\bstruct\s+\w+', code)),
-                'traits': len(re.findall(r'\btrait\s+\w+', code)),
-            })
+            js_result = _shared_js_scanner().scan_file(file_path)
+            if 'error' not in js_result and 'skipped' not in js_result:
+                result.update({
+                    'functions': len(js_result['functions']),
+                    'classes': len(js_result['classes']),
+                    'imports': len(js_result['imports']),
+                    'complexity': js_result['complexity'],
+                    'file_type': js_result['type'],
+                })
+        
+        elif ext in _DEFINITION_RES:
+            definitions_re = _DEFINITION_RES[ext]
+            counts = Counter(m.lastgroup for m in definitions_re.finditer(code))
+            result.update({kind: counts[kind] for kind in definitions_re.groupindex})
         
         security_issues = []
         quality_issues = []
         
-        if 'eval(' in code:
+        markers = _CODE_MARKERS.found(code)
+        if 'eval(' in markers:
             security_issues.append('Use of eval() detected')
-        if re.search(r'password\s*=\s*["\']', code, re.I):
+        if _PASSWORD_ASSIGN_RE.search(code):
             security_issues.append('Hardcoded password detected')
-        if 'exec(' in code:
+        if 'exec(' in markers:
             security_issues.append('Use of exec() detected')
         
-        if len(non_empty_lines) > 500:
+        if code_lines > 500:
             quality_issues.append('Large file (>500 lines)')
-        if len(code) > 10000:
+        if size > 10000:
             quality_issues.append('Large file size (>10KB)')
         
         result['security_issues'] = security_issues
@@ -169,7 +373,7 @@ def analyze_file_wrapper(file_path):
         result['issue_count'] = len(security_issues) + len(quality_issues)
         
         return {
-            'file': str(file_path),
+            'file': file_path,
             'result': result,
             'status': 'success'
         }
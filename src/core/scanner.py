@@ -1,19 +1,76 @@
 import ast
 import os
+import sys
+import threading
 import pathlib
 import json
-from typing import Dict, List, Set, Optional, Any
-from dataclasses import dataclass, field, asdict
-from collections import defaultdict
+from typing import Dict, List, Set, Optional, Any, Tuple, Union
+from dataclasses import dataclass, field
+from enum import IntFlag
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import hashlib
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pathspec
+    PATHSPEC_AVAILABLE = True
+except ImportError:
+    PATHSPEC_AVAILABLE = False
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+def _encode_json(obj: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+class AnalyzeFlags(IntFlag):
+    pass
+    IMPORTS = 1
+    FUNCS = 2
+    CLASSES = 4
+    COMPLEXITY = 8
+    ALL = IMPORTS | FUNCS | CLASSES | COMPLEXITY
+
+_COMPLEXITY_NODES = frozenset({ast.If, ast.For, ast.While, ast.ExceptHandler, ast.With})
+
+# Imports, definitions and every _COMPLEXITY_NODES type only occur at statement
+# level, so the walk never needs to enter expressions.
+_BLOCK_NODES = (ast.stmt, ast.excepthandler) + ((ast.match_case,) if hasattr(ast, 'match_case') else ())
+
+_READ_BLOCK_BYTES = 1024 * 1024
+
+# One read buffer per thread, reused for every file it hashes. Module level
+# so it never travels with a pickled scanner to worker processes.
+_read_buffers = threading.local()
+
+def _read_buffer() -> bytearray:
+    buf = getattr(_read_buffers, 'buf', None)
+    if buf is None:
+        buf = _read_buffers.buf = bytearray(_READ_BLOCK_BYTES)
+    return buf
+
+# Below _THREAD_MIN_FILES files scanning runs inline; up to _PARALLEL_MIN_FILES
+# a few threads overlap the reads and hashing (both release the GIL); beyond
+# that worker processes are worth their start-up cost.
+_THREAD_MIN_FILES = 8
+_PARALLEL_MIN_FILES = 64
+_MAX_SCAN_THREADS = 8
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 LANGUAGE_EXTENSIONS = {
     'Python': ['.py', '.pyw'],
     'JavaScript': ['.js', '.jsx', '.mjs'],
@@ -37,7 +94,7 @@ LANGUAGE_EXTENSIONS = {
     'SQL': ['.sql'],
 }
 
-@dataclass
+@dataclass(**_SLOTS)
 class FileMetadata:
     pass
     path: str
@@ -51,9 +108,19 @@ class FileMetadata:
     complexity_score: float = 0.0
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'path': self.path,
+            'size': self.size,
+            'lines': self.lines,
+            'language': self.language,
+            'file_hash': self.file_hash,
+            'imports': self.imports,
+            'functions': self.functions,
+            'classes': self.classes,
+            'complexity_score': self.complexity_score
+        }
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProjectStructure:
     pass
     root_path: str
@@ -82,6 +149,10 @@ class PulseScanner:
         'build', '*.pyc', '*.pyo', '*.egg-info', '.DS_Store'
     }
     
+    # Split once so exclusion is a set lookup plus one C-level endswith
+    _EXCLUDE_NAMES = frozenset(p for p in EXCLUDE_PATTERNS if not p.startswith('*'))
+    _EXCLUDE_SUFFIXES = tuple(p[1:] for p in EXCLUDE_PATTERNS if p.startswith('*'))
+    
     LANGUAGE_MAP = {
         '.py': 'Python',
         '.pyw': 'Python',
@@ -119,36 +190,144 @@ class PulseScanner:
         '.sql': 'SQL',
     }
     
-    def __init__(self, root_path: str, max_depth: int = 10, follow_symlinks: bool = False):
+    def __init__(self, root_path: str, max_depth: int = 10, follow_symlinks: bool = False,
+                 max_workers: Optional[int] = None, store_docstrings: bool = False,
+                 analyze_flags: AnalyzeFlags = AnalyzeFlags.ALL, cache_file: Optional[str] = None,
+                 use_gitignore: bool = True):
         self.root_path = pathlib.Path(root_path).resolve()
+        # Walked paths are plain strings under this prefix; slicing it off is
+        # cheaper than Path.relative_to for every file.
+        self._root_prefix = os.path.join(str(self.root_path), '')
         self.max_depth = max_depth
         self.follow_symlinks = follow_symlinks
+        self.store_docstrings = store_docstrings
+        self.analyze_flags = analyze_flags
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._gitignore_enabled = use_gitignore and PATHSPEC_AVAILABLE
+        self._ignore_specs = self._load_ignore_specs() if self._gitignore_enabled else []
         self.structure = ProjectStructure(root_path=str(self.root_path))
+        # (dev, inode, size, mtime) -> (hash, lines), and content hash -> AST
+        # analysis, so hard links, re-scans and byte-identical files such as
+        # empty __init__.py are read and parsed once per process.
+        self._content_cache: Dict[Tuple[int, int, int, int], Tuple[str, int]] = {}
+        self.cache_file = pathlib.Path(cache_file) if cache_file else None
+        self._analysis_cache: Dict[str, Dict[str, Any]] = self._load_analysis_cache()
         
         logger.info(f"Initialized scanner for: {self.root_path}")
     
-    def should_exclude(self, path: pathlib.Path) -> bool:
-        for pattern in self.EXCLUDE_PATTERNS:
-            if pattern.startswith('*'):
-                if path.name.endswith(pattern[1:]):
-                    return True
-            else:
-                if pattern in path.parts:
-                    return True
-        return False
+    def _cache_settings(self) -> List[Any]:
+        # Analyses made with other flags or docstring settings are not reusable
+        return [int(self.analyze_flags), self.store_docstrings]
     
-    def calculate_file_hash(self, file_path: pathlib.Path) -> str:
-        sha256_hash = hashlib.sha256()
+    def _load_analysis_cache(self) -> Dict[str, Dict[str, Any]]:
+        if self.cache_file is None or not self.cache_file.is_file():
+            return {}
+        try:
+            with open(self.cache_file, 'rb') as f:
+                data = orjson.loads(f.read()) if ORJSON_AVAILABLE else json.load(f)
+            if data.get('settings') != self._cache_settings():
+                return {}
+            analyses = data['analyses']
+            logger.info(f"Loaded {len(analyses)} cached analyses from {self.cache_file}")
+            return analyses
+        except Exception as e:
+            logger.error(f"Error loading analysis cache {self.cache_file}: {e}")
+            return {}
+    
+    def _save_analysis_cache(self) -> None:
+        # Rebuilt from the scanned files: analyses made in worker processes are
+        # collected here, and entries for files that no longer exist are dropped.
+        analyses = {}
+        for fm in self.structure.files:
+            if fm.path.endswith('.py'):
+                analyses[fm.file_hash] = {
+                    'imports': fm.imports,
+                    'functions': fm.functions,
+                    'classes': fm.classes,
+                    'complexity': fm.complexity_score
+                }
+        self._analysis_cache.update(analyses)
+        
+        tmp_path = self.cache_file.with_name(self.cache_file.name + '.tmp')
         try:
-            with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
+            with open(tmp_path, 'wb') as f:
+                f.write(_encode_json({'settings': self._cache_settings(), 'analyses': analyses}))
+            os.replace(tmp_path, self.cache_file)
         except Exception as e:
-            logger.warning(f"Could not hash file {file_path}: {e}")
-            return ""
+            logger.error(f"Error saving analysis cache {self.cache_file}: {e}")
+    
+    def should_exclude(self, name: str) -> bool:
+        return name in self._EXCLUDE_NAMES or name.endswith(self._EXCLUDE_SUFFIXES)
+    
+    def _read_ignore_spec(self, directory: str) -> Optional[Tuple[str, Any]]:
+        ignore_file = os.path.join(directory, '.gitignore')
+        if not os.path.isfile(ignore_file):
+            return None
+        try:
+            with open(ignore_file, 'r', encoding='utf-8', errors='replace') as f:
+                spec = pathspec.GitIgnoreSpec.from_lines(f)
+        except OSError as e:
+            logger.warning(f"Could not read {ignore_file}: {e}")
+            return None
+        # Patterns are relative to the directory holding the .gitignore
+        return os.path.join(directory, ''), spec
+    
+    def _load_ignore_specs(self) -> List[Tuple[str, Any]]:
+        # The root's .gitignore plus, inside a git checkout, those of its
+        # ancestors up to the top level. Nested ones are picked up by the walk.
+        found = []
+        for directory in (self.root_path, *self.root_path.parents):
+            entry = self._read_ignore_spec(str(directory))
+            if entry is not None:
+                found.insert(0, entry)
+            if (directory / '.git').exists():
+                return found
+        return found[-1:] if found and found[-1][0] == self._root_prefix else []
+    
+    def _is_ignored(self, path: str, is_dir: bool, specs: List[Tuple[str, Any]]) -> bool:
+        for prefix, spec in specs:
+            rel_path = path[len(prefix):]
+            if spec.match_file(rel_path + '/' if is_dir else rel_path):
+                return True
+        return False
+    
+    def _hash_and_count(self, file_path: str, size_hint: int = _READ_BLOCK_BYTES) -> Tuple[str, int]:
+        # One binary read feeds both the hash and the line count. Lines are
+        # counted the way text mode splits them: '\n', '\r\n' and a lone '\r'.
+        # The thread's reused buffer keeps reads allocation-free, so the time
+        # goes to OpenSSL's SHA-256 rather than the interpreter.
+        sha256_hash = hashlib.sha256()
+        buf = _read_buffer()
+        view = memoryview(buf)
+        newlines = 0
+        last = None
+        with open(file_path, "rb", buffering=0) as f:
+            if size_hint > _READ_BLOCK_BYTES and hasattr(os, 'posix_fadvise'):
+                # Multi-block files are read front to back exactly once
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                sha256_hash.update(view[:n])
+                newlines += buf.count(b'\n', 0, n) + buf.count(b'\r', 0, n) - buf.count(b'\r\n', 0, n)
+                if last == 0x0D and buf[0] == 0x0A:
+                    newlines -= 1
+                last = buf[n - 1]
+        lines = newlines + (1 if last is not None and last not in (0x0A, 0x0D) else 0)
+        return sha256_hash.hexdigest(), lines
+    
+    def _docstring(self, node) -> Optional[str]:
+        # Summary line only, read straight off the AST; get_docstring's
+        # cleandoc pass over the whole text is skipped.
+        if not self.store_docstrings or not node.body:
+            return None
+        first = node.body[0]
+        if first.__class__ is ast.Expr and first.value.__class__ is ast.Constant and isinstance(first.value.value, str):
+            return first.value.value.lstrip().partition('\n')[0].rstrip()
+        return None
     
-    def analyze_python_ast(self, file_path: pathlib.Path) -> Dict[str, Any]:
+    def analyze_python_ast(self, file_path: Union[str, pathlib.Path]) -> Dict[str, Any]:
         result = {
             'imports': [],
             'functions': [],
@@ -160,47 +339,77 @@ class PulseScanner:
             with open(file_path, 'r', encoding='utf-8') as f:
                 source_code = f.read()
             
-            tree = ast.parse(source_code, filename=str(file_path))
+            tree = ast.parse(source_code, filename=os.fspath(file_path))
             
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        result['imports'].append(alias.name)
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        result['imports'].append(node.module)
-                
-                elif isinstance(node, ast.FunctionDef):
-                    func_info = {
-                        'name': node.name,
-                        'args': [arg.arg for arg in node.args.args],
-                        'lineno': node.lineno,
-                        'docstring': ast.get_docstring(node),
-                        'is_async': isinstance(node, ast.AsyncFunctionDef)
-                    }
-                    result['functions'].append(func_info)
+            flags = self.analyze_flags
+            want_imports = AnalyzeFlags.IMPORTS in flags
+            want_functions = AnalyzeFlags.FUNCS in flags
+            want_classes = AnalyzeFlags.CLASSES in flags
+            want_complexity = AnalyzeFlags.COMPLEXITY in flags
+            total_functions = 0
+            
+            # One breadth-first pass (ast.walk's order) carrying the number of
+            # enclosing functions: a branch inside nested functions counts once
+            # for each of them, as when every function was walked separately.
+            # Levels are plain lists and child fields are read inline, so no
+            # deque or ast.iter_child_nodes generator is involved. Whatever the
+            # flags, every block is entered: imports under try/if and nested
+            # functions count wherever they are.
+            level = [(tree, 0)]
+            while level:
+                next_level = []
+                push = next_level.append
+                for node, func_depth in level:
+                    node_type = node.__class__
                     
-                    result['complexity'] += sum(1 for _ in ast.walk(node) 
-                                               if isinstance(_, (ast.If, ast.For, ast.While, 
-                                                               ast.ExceptHandler, ast.With)))
-                
-                elif isinstance(node, ast.ClassDef):
-                    class_info = {
-                        'name': node.name,
-                        'lineno': node.lineno,
-                        'docstring': ast.get_docstring(node),
-                        'methods': [],
-                        'bases': [base.id for base in node.bases if isinstance(base, ast.Name)]
-                    }
+                    if node_type is ast.Import:
+                        if want_imports:
+                            for alias in node.names:
+                                result['imports'].append(alias.name)
+                    elif node_type is ast.ImportFrom:
+                        if want_imports and node.module:
+                            result['imports'].append(node.module)
+                    
+                    elif node_type is ast.FunctionDef:
+                        total_functions += 1
+                        if want_functions:
+                            func_info = {
+                                'name': node.name,
+                                'args': [arg.arg for arg in node.args.args],
+                                'lineno': node.lineno,
+                                'docstring': self._docstring(node),
+                                'is_async': False
+                            }
+                            result['functions'].append(func_info)
+                        func_depth += 1
+                    
+                    elif node_type is ast.ClassDef:
+                        methods = [item.name for item in node.body
+                                   if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))]
+                        total_functions += len(methods)
+                        if want_classes:
+                            class_info = {
+                                'name': node.name,
+                                'lineno': node.lineno,
+                                'docstring': self._docstring(node),
+                                'methods': methods,
+                                'bases': [base.id for base in node.bases if isinstance(base, ast.Name)] if node.bases else []
+                            }
+                            result['classes'].append(class_info)
                     
-                    for item in node.body:
-                        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                            class_info['methods'].append(item.name)
+                    elif want_complexity and node_type in _COMPLEXITY_NODES:
+                        result['complexity'] += func_depth
                     
-                    result['classes'].append(class_info)
+                    for name in node._fields:
+                        value = getattr(node, name, None)
+                        if value.__class__ is list:
+                            for item in value:
+                                if isinstance(item, _BLOCK_NODES):
+                                    push((item, func_depth))
+                
+                level = next_level
             
-            total_functions = len(result['functions']) + sum(len(c['methods']) for c in result['classes'])
-            if total_functions > 0:
+            if want_complexity and total_functions > 0:
                 result['complexity'] = min(100, (result['complexity'] / total_functions) * 10)
             
         except SyntaxError as e:
@@ -210,25 +419,36 @@ class PulseScanner:
         
         return result
     
-    def scan_file(self, file_path: pathlib.Path) -> Optional[FileMetadata]:
+    def scan_file(self, file_path: Union[str, pathlib.Path]) -> Optional[FileMetadata]:
         try:
-            stat = file_path.stat()
+            file_path = os.fspath(file_path)
+            stat = os.stat(file_path)
             
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = sum(1 for _ in f)
+            key = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            content = self._content_cache.get(key)
+            if content is None:
+                content = self._content_cache[key] = self._hash_and_count(file_path, stat.st_size)
+            file_hash, lines = content
             
-            language = self.LANGUAGE_MAP.get(file_path.suffix, 'Unknown')
+            suffix = os.path.splitext(file_path)[1]
+            language = self.LANGUAGE_MAP.get(suffix, 'Unknown')
+            if file_path.startswith(self._root_prefix):
+                rel_path = file_path[len(self._root_prefix):]
+            else:
+                rel_path = str(pathlib.Path(file_path).relative_to(self.root_path))
             
             metadata = FileMetadata(
-                path=str(file_path.relative_to(self.root_path)),
+                path=rel_path,
                 size=stat.st_size,
                 lines=lines,
                 language=language,
-                file_hash=self.calculate_file_hash(file_path)
+                file_hash=file_hash
             )
             
-            if file_path.suffix == '.py':
-                analysis = self.analyze_python_ast(file_path)
+            if suffix == '.py':
+                analysis = self._analysis_cache.get(file_hash)
+                if analysis is None:
+                    analysis = self._analysis_cache[file_hash] = self.analyze_python_ast(file_path)
                 metadata.imports = analysis['imports']
                 metadata.functions = analysis['functions']
                 metadata.classes = analysis['classes']
@@ -241,69 +461,150 @@ class PulseScanner:
             return None
     
     def build_dependency_graph(self) -> Dict[str, List[str]]:
-        graph = defaultdict(list)
-        
         module_to_file = {}
         for file_meta in self.structure.files:
             if file_meta.language == 'Python':
                 module_name = file_meta.path.replace('/', '.').replace('.py', '')
                 module_to_file[module_name] = file_meta.path
         
+        graph = {}
         for file_meta in self.structure.files:
-            if file_meta.language == 'Python':
-                for import_name in file_meta.imports:
-                    if import_name in module_to_file:
-                        graph[file_meta.path].append(module_to_file[import_name])
+            if file_meta.language != 'Python' or not file_meta.imports:
+                continue
+            
+            deps = []
+            for import_name in file_meta.imports:
+                # "import pkg.mod.attr" resolves to the deepest scanned module
+                target = module_to_file.get(import_name)
+                while target is None and '.' in import_name:
+                    import_name = import_name.rsplit('.', 1)[0]
+                    target = module_to_file.get(import_name)
+                if target is not None:
+                    deps.append(target)
+            
+            if deps:
+                graph[file_meta.path] = deps
         
-        return dict(graph)
+        return graph
     
-    def scan(self) -> ProjectStructure:
-        logger.info(f"Starting scan of {self.root_path}")
-        
-        language_counts = defaultdict(int)
+    def _collect_paths(self) -> List[str]:
+        # Iterative scandir walk in os.walk's top-down order. Entry types come
+        # from the directory listing itself, and directories past max_depth
+        # are never opened.
+        paths = []
+        use_gitignore = self._gitignore_enabled
+        stack = [(str(self.root_path), 0, self._ignore_specs)]
         
-        for root, dirs, files in os.walk(self.root_path, followlinks=self.follow_symlinks):
-            current_path = pathlib.Path(root)
+        while stack:
+            dir_path, depth, ignore_specs = stack.pop()
             
             try:
-                depth = len(current_path.relative_to(self.root_path).parts)
-            except ValueError:
-                continue
-            
-            if depth > self.max_depth:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except OSError:
                 continue
             
-            dirs[:] = [d for d in dirs if not self.should_exclude(current_path / d)]
+            if use_gitignore and depth and any(entry.name == '.gitignore' for entry in entries):
+                nested = self._read_ignore_spec(dir_path)
+                if nested is not None:
+                    ignore_specs = ignore_specs + [nested]
             
-            for filename in files:
-                file_path = current_path / filename
+            subdirs = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
                 
-                if self.should_exclude(file_path):
+                if is_dir:
+                    if depth >= self.max_depth or self.should_exclude(entry.name):
+                        continue
+                    # Ignored subtrees are pruned without being listed
+                    if ignore_specs and self._is_ignored(entry.path, True, ignore_specs):
+                        continue
+                    if self.follow_symlinks or not entry.is_symlink():
+                        subdirs.append(entry.path)
                     continue
                 
-                if file_path.suffix not in self.LANGUAGE_MAP:
+                if self.should_exclude(entry.name) or os.path.splitext(entry.name)[1] not in self.LANGUAGE_MAP:
+                    continue
+                if ignore_specs and self._is_ignored(entry.path, False, ignore_specs):
                     continue
                 
-                metadata = self.scan_file(file_path)
-                if metadata:
-                    self.structure.files.append(metadata)
-                    self.structure.total_lines += metadata.lines
-                    language_counts[metadata.language] += 1
+                paths.append(entry.path)
+            
+            stack.extend((subdir, depth + 1, ignore_specs) for subdir in reversed(subdirs))
+        
+        return paths
+    
+    def _process_paths(self, paths: List[str]):
+        if self.max_workers <= 1 or len(paths) < _THREAD_MIN_FILES:
+            yield from map(self.scan_file, paths)
+            return
+        
+        if len(paths) < _PARALLEL_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=min(_MAX_SCAN_THREADS, self.max_workers)) as executor:
+                yield from executor.map(self.scan_file, paths)
+            return
+        
+        # Each worker gets its own copy of the scanner once, then only paths
+        # and FileMetadata cross the process boundary.
+        chunksize = max(1, len(paths) // (self.max_workers * 4))
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_scan_worker,
+                                 initargs=(self,)) as executor:
+            yield from executor.map(_scan_file_worker, paths, chunksize=chunksize)
+    
+    def scan(self) -> ProjectStructure:
+        logger.info(f"Starting scan of {self.root_path}")
+        
+        files = self.structure.files
+        paths = self._collect_paths()
+        files.extend(metadata for metadata in self._process_paths(paths) if metadata)
         
-        self.structure.total_files = len(self.structure.files)
-        self.structure.languages = dict(language_counts)
+        self.structure.total_files = len(files)
+        self.structure.total_lines = sum(fm.lines for fm in files)
+        self.structure.languages = dict(Counter(fm.language for fm in files))
         self.structure.dependency_graph = self.build_dependency_graph()
         
+        if self.cache_file is not None:
+            self._save_analysis_cache()
+        
         logger.info(f"Scan complete: {self.structure.total_files} files, "
                    f"{self.structure.total_lines} lines")
         
         return self.structure
     
     def export_json(self, output_path: str) -> None:
+        # Streamed one file record at a time: no asdict() deep copy and no
+        # whole-document string.
+        structure = self.structure
+        with open(output_path, 'wb') as f:
+            f.write(b'{"root_path": ' + _encode_json(structure.root_path))
+            f.write(b', "total_files": ' + _encode_json(structure.total_files))
+            f.write(b', "total_lines": ' + _encode_json(structure.total_lines))
+            f.write(b', "languages": ' + _encode_json(structure.languages))
+            f.write(b', "files": [')
+            for i, file_meta in enumerate(structure.files):
+                if i:
+                    f.write(b', ')
+                f.write(_encode_json(file_meta.to_dict()))
+            f.write(b'], "dependency_graph": ' + _encode_json(structure.dependency_graph) + b'}')
+        logger.info(f"Exported scan results to {output_path}")
+    
+    def export_pretty(self, output_path: str) -> None:
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(self.structure.to_dict(), f, indent=2)
         logger.info(f"Exported scan results to {output_path}")
 
+_worker_scanner = None
+
+def _init_scan_worker(scanner: 'PulseScanner'):
+    global _worker_scanner
+    _worker_scanner = scanner
+
+def _scan_file_worker(file_path: str) -> Optional[FileMetadata]:
+    return _worker_scanner.scan_file(file_path)
+
 def main():
     import sys
     
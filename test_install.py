@@ -4,8 +4,13 @@ Run this to verify CodePulse installation
 """
 
 import sys
+from importlib.util import find_spec
 from pathlib import Path
 
+def is_installed(package: str) -> bool:
+    """Locate the package without importing it"""
+    return package in sys.modules or find_spec(package) is not None
+
 def check_installation():
     """Verify all dependencies are installed"""
     
@@ -20,10 +25,9 @@ def check_installation():
     all_good = True
     
     for package, description in required.items():
-        try:
-            __import__(package)
+        if is_installed(package):
             print(f"✅ {package:15} - {description}")
-        except ImportError:
+        else:
             print(f"❌ {package:15} - {description} (MISSING)")
             all_good = False
     
@@ -36,10 +40,9 @@ def check_installation():
     }
     
     for package, description in optional.items():
-        try:
-            __import__(package)
+        if is_installed(package):
             print(f"✅ {package:15} - {description}")
-        except ImportError:
+        else:
             print(f"⚪ {package:15} - {description} (not installed)")
     
     print("\n" + "="*50)
@@ -0,0 +1,95 @@
+import pytest
+
+from src.core import cache as cache_module
+from src.core.cache import AnalysisCache
+from src.core.fast_scanner import FastScanner
+
+RESULT = {'file': 'mod.py', 'status': 'success', 'lines': 3, 'functions': 1}
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / 'cache')
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'mod.py'
+    path.write_text('def f():\n    return 1\n', encoding='utf-8')
+    return path
+
+
+def test_cold_cache_misses(cache_dir, source):
+    cache = AnalysisCache(cache_dir)
+
+    assert cache.get(source) is None
+    assert cache.get_stats()['misses'] == 1
+
+
+def test_warm_cache_hits_in_process_and_from_disk(cache_dir, source):
+    cache = AnalysisCache(cache_dir)
+    assert cache.set(source, RESULT)
+
+    assert cache.get(source) == RESULT
+    cache.save_index()
+
+    reopened = AnalysisCache(cache_dir)
+    assert reopened.get(source) == RESULT
+    assert reopened.get_stats() == {'hits': 1, 'misses': 0, 'total_requests': 1, 'hit_rate': '100.0%'}
+
+
+def test_changed_file_misses(cache_dir, source):
+    cache = AnalysisCache(cache_dir)
+    cache.set(source, RESULT)
+
+    source.write_text('def f():\n    return 2\n', encoding='utf-8')
+
+    assert cache.get(source) is None
+
+
+def test_identical_files_keep_their_own_entries(cache_dir, tmp_path, source):
+    twin = tmp_path / 'twin.py'
+    twin.write_bytes(source.read_bytes())
+    cache = AnalysisCache(cache_dir)
+
+    cache.set(source, RESULT)
+
+    assert cache.get(twin) is None
+    cache.set(twin, dict(RESULT, file='twin.py'))
+    assert cache.get(source) == RESULT
+    assert cache.get(twin) == dict(RESULT, file='twin.py')
+
+
+def test_saved_index_skips_rehashing_unchanged_files(cache_dir, source, monkeypatch):
+    cache = AnalysisCache(cache_dir)
+    cache.set(source, RESULT)
+    cache.save_index()
+
+    calls = []
+    content_key = cache_module.content_key
+    monkeypatch.setattr(cache_module, 'content_key', lambda path: calls.append(path) or content_key(path))
+
+    assert AnalysisCache(cache_dir).get(source) == RESULT
+    assert calls == []
+    assert AnalysisCache(cache_dir, strict=True).get(source) == RESULT
+    assert calls == [str(source)]
+
+
+def test_fast_scanner_warm_run_matches_cold_run(tmp_path, monkeypatch):
+    project = tmp_path / 'project'
+    project.mkdir()
+    for index in range(3):
+        (project / f'mod{index}.py').write_text(f'import os\n\ndef f{index}():\n    return {index}\n', encoding='utf-8')
+    (project / 'empty.py').write_text('', encoding='utf-8')
+    (project / 'copy.py').write_text('', encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+
+    with FastScanner(max_workers=2, use_incremental=False) as scanner:
+        cold = scanner.scan_project(str(project))
+    with FastScanner(max_workers=2, use_incremental=False) as scanner:
+        warm = scanner.scan_project(str(project))
+
+    assert cold['stats']['cache']['misses'] == 5
+    assert warm['stats']['cache']['hits'] == 5
+    assert warm['results'] == cold['results']
+    assert [result['file'] for result in warm['results']] == [result['file'] for result in cold['results']]
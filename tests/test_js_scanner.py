@@ -0,0 +1,96 @@
+import pytest
+
+from src.core.js_scanner import JavaScriptScanner
+
+SAMPLE = '''import React from 'react';
+import { helper } from "./utils";
+const fs = require('fs');
+const again = require('fs');
+
+/* Block comment
+   spanning lines */
+// line comment
+
+export default class Widget extends React.Component {
+  render() { return null; }
+}
+
+export function build(options) {
+  if (options && options.debug) {
+    for (const key in options) {
+      console.log(key);
+    }
+  } else {
+    return options || {};
+  }
+}
+
+export const compute = async (a, b) => a ? b : a;
+
+function größe(wert) {
+  while (wert) { wert--; }
+  return fetch(wert).then(r => r).catch(e => e);
+}
+
+class Café {}
+
+const handlers = {
+  onClick: (event) => event,
+  onLoad: async () => { await load(); },
+};
+
+switch (x) {
+  case 1: break;
+}
+try { a(); } catch (err) {}
+'''
+
+# What the original str-pattern scanner reported for SAMPLE; it deduplicated
+# imports through a set, so only their membership is fixed.
+EXPECTED = {
+    'total_lines': 42,
+    'code_lines': 30,
+    'imports': ['./utils', 'fs', 'react'],
+    'functions': [
+        {'name': 'build', 'type': 'function'},
+        {'name': 'compute', 'type': 'function'},
+        {'name': 'größe', 'type': 'function'},
+        {'name': 'onClick', 'type': 'function'},
+        {'name': 'onLoad', 'type': 'function'},
+    ],
+    'classes': ['Widget', 'Café'],
+    'exports': ['Widget', 'build', 'compute'],
+    'complexity': 8,
+    'features': {'async': False, 'promises': True},
+    'type': 'React Component',
+}
+
+
+@pytest.mark.parametrize('name, language', [('app.js', 'JavaScript'), ('app.ts', 'TypeScript')])
+def test_scan_file_matches_baseline(tmp_path, name, language):
+    path = tmp_path / name
+    path.write_text(SAMPLE, encoding='utf-8')
+
+    result = JavaScriptScanner().scan_file(str(path))
+
+    result['imports'] = sorted(result['imports'])
+    assert result == dict(EXPECTED, path=str(path), language=language)
+
+
+def test_scan_file_accepts_dollar_identifiers(tmp_path):
+    path = tmp_path / 'jq.js'
+    path.write_text('function $query(sel) {}\nclass $Store {}\n', encoding='utf-8')
+
+    result = JavaScriptScanner().scan_file(str(path))
+
+    assert result['functions'] == [{'name': '$query', 'type': 'function'}]
+    assert result['classes'] == ['$Store']
+
+
+def test_scan_file_skips_minified_bundles(tmp_path):
+    path = tmp_path / 'vendor.min.js'
+    path.write_text('function a(){}', encoding='utf-8')
+
+    result = JavaScriptScanner().scan_file(str(path))
+
+    assert result == {'path': str(path), 'skipped': 'large_or_minified', 'size': 14}
@@ -0,0 +1,53 @@
+from src.core.multi_format_scanner import SQLScanner
+
+SAMPLE = '''CREATE TABLE users (id INT, password, varchar(20));
+SELECT * FROM users; DROP DATABASE prod;
+GRANT ALL ON t TO PUBLIC;
+TRUNCATE TABLE x; -- comment
+GRANT SELECT ON t TO public;
+GRANT ALL ON t TO bob;
+UPDATE u SET password = 'secret', password, VARCHAR;
+EXEC (@sql); DROP DATABASE a; SELECT * FROM b; TRUNCATE TABLE c
+'''
+
+# What the original per-line scanner reported for SAMPLE, in its order:
+# grouped by check, by line within a check, by pattern within a line.
+EXPECTED = [
+    ('SQL Comment (potential injection)', 'HIGH', 4, 'TRUNCATE TABLE x; -- comment'),
+    ('Dynamic SQL Execution', 'HIGH', 8, 'EXEC (@sql); DROP DATABASE a; SELECT * FROM b; TRUNCATE TABLE c'),
+    ('DROP DATABASE', 'CRITICAL', 2, 'SELECT * FROM users; DROP DATABASE prod;'),
+    ('SELECT *', 'LOW', 2, 'SELECT * FROM users; DROP DATABASE prod;'),
+    ('TRUNCATE TABLE', 'HIGH', 4, 'TRUNCATE TABLE x; -- comment'),
+    ('DROP DATABASE', 'CRITICAL', 8, 'EXEC (@sql); DROP DATABASE a; SELECT * FROM b; TRUNCATE TABLE c'),
+    ('TRUNCATE TABLE', 'HIGH', 8, 'EXEC (@sql); DROP DATABASE a; SELECT * FROM b; TRUNCATE TABLE c'),
+    ('SELECT *', 'LOW', 8, 'EXEC (@sql); DROP DATABASE a; SELECT * FROM b; TRUNCATE TABLE c'),
+    ('Plain Text Password Storage', 'CRITICAL', 1, 'CREATE TABLE users (id INT, password, varchar(20));'),
+    ('Hardcoded Password', 'CRITICAL', 7, "PASSWORD = '***'"),
+    ('Plain Text Password Storage', 'CRITICAL', 7, "UPDATE u SET password = 'secret', password, VARCHAR;"),
+    ('Excessive Permissions', 'HIGH', 3, 'GRANT ALL ON t TO PUBLIC;'),
+    ('Public Access', 'HIGH', 3, 'GRANT ALL ON t TO PUBLIC;'),
+    ('Public Access', 'HIGH', 5, 'GRANT SELECT ON t TO public;'),
+    ('Excessive Permissions', 'HIGH', 6, 'GRANT ALL ON t TO bob;'),
+]
+
+
+def _summaries(issues):
+    return [(issue.type, issue.severity, issue.line, issue.code_snippet) for issue in issues]
+
+
+def test_sql_scan_matches_baseline(tmp_path):
+    path = tmp_path / 'schema.sql'
+    path.write_text(SAMPLE, encoding='utf-8')
+
+    assert _summaries(SQLScanner().scan(str(path))) == EXPECTED
+
+
+def test_sql_scan_handles_crlf(tmp_path):
+    path = tmp_path / 'schema.sql'
+    path.write_bytes(SAMPLE.replace('\n', '\r\n').encode('utf-8'))
+
+    assert _summaries(SQLScanner().scan(str(path))) == EXPECTED
+
+
+def test_sql_scan_missing_file(tmp_path):
+    assert SQLScanner().scan(str(tmp_path / 'missing.sql')) == []
@@ -0,0 +1,124 @@
+from itertools import combinations
+
+import pytest
+
+from src.core.scanner import AnalyzeFlags, PulseScanner
+
+SAMPLE = '''import os
+import sys as system, json
+from collections import OrderedDict
+from . import sibling
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+def top(a, b=1):
+    """Top-level function."""
+    if a:
+        for x in b:
+            while x:
+                pass
+    return a
+
+
+async def fetch(url):
+    with open(url) as f:
+        return f.read()
+
+
+class Base:
+    pass
+
+
+class Child(Base, mixins.Extra):
+    """A child class."""
+
+    def method(self, value):
+        try:
+            return value
+        except ValueError:
+            if value:
+                return None
+
+    async def run(self):
+        pass
+
+    def outer(self):
+        def inner():
+            if True:
+                return 1
+        with open(__file__):
+            return inner
+'''
+
+# What the original ast.walk implementation reported for SAMPLE
+EXPECTED = {
+    'imports': ['os', 'sys', 'json', 'collections', 'yaml'],
+    'functions': [
+        {'name': 'top', 'args': ['a', 'b'], 'lineno': 12, 'docstring': 'Top-level function.', 'is_async': False},
+        {'name': 'method', 'args': ['self', 'value'], 'lineno': 33, 'docstring': None, 'is_async': False},
+        {'name': 'outer', 'args': ['self'], 'lineno': 43, 'docstring': None, 'is_async': False},
+        {'name': 'inner', 'args': [], 'lineno': 44, 'docstring': None, 'is_async': False},
+    ],
+    'classes': [
+        {'name': 'Base', 'lineno': 26, 'docstring': None, 'methods': [], 'bases': []},
+        {'name': 'Child', 'lineno': 30, 'docstring': 'A child class.',
+         'methods': ['method', 'run', 'outer'], 'bases': ['Base']},
+    ],
+    'complexity': 8 / 7 * 10,
+}
+
+_SINGLE_FLAGS = [AnalyzeFlags.IMPORTS, AnalyzeFlags.FUNCS, AnalyzeFlags.CLASSES, AnalyzeFlags.COMPLEXITY]
+_FLAG_KEYS = {
+    AnalyzeFlags.IMPORTS: 'imports',
+    AnalyzeFlags.FUNCS: 'functions',
+    AnalyzeFlags.CLASSES: 'classes',
+    AnalyzeFlags.COMPLEXITY: 'complexity',
+}
+_ALL_COMBINATIONS = [
+    AnalyzeFlags(sum(combo))
+    for size in range(len(_SINGLE_FLAGS) + 1)
+    for combo in combinations(_SINGLE_FLAGS, size)
+]
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    path = tmp_path / 'sample.py'
+    path.write_text(SAMPLE, encoding='utf-8')
+    return path
+
+
+@pytest.mark.parametrize('flags', _ALL_COMBINATIONS, ids=lambda flags: str(int(flags)))
+def test_analyze_python_ast_matches_baseline_for_flags(tmp_path, sample_file, flags):
+    scanner = PulseScanner(str(tmp_path), store_docstrings=True, analyze_flags=flags)
+
+    result = scanner.analyze_python_ast(sample_file)
+
+    expected = {'imports': [], 'functions': [], 'classes': [], 'complexity': 0}
+    for flag, key in _FLAG_KEYS.items():
+        if flag in flags:
+            expected[key] = EXPECTED[key]
+    assert result == expected
+
+
+def test_analyze_python_ast_without_docstrings(tmp_path, sample_file):
+    scanner = PulseScanner(str(tmp_path))
+
+    result = scanner.analyze_python_ast(sample_file)
+
+    assert [f['docstring'] for f in result['functions']] == [None] * 4
+    assert [c['docstring'] for c in result['classes']] == [None, None]
+    assert result['complexity'] == EXPECTED['complexity']
+
+
+def test_analyze_python_ast_syntax_error(tmp_path):
+    path = tmp_path / 'broken.py'
+    path.write_text('def broken(:\n', encoding='utf-8')
+
+    result = PulseScanner(str(tmp_path)).analyze_python_ast(path)
+
+    assert result == {'imports': [], 'functions': [], 'classes': [], 'complexity': 0}